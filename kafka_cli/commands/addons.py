@@ -1,12 +1,9 @@
-import os
 import typer
-import yaml
 from enum import Enum
-from typing import Optional
+from typing import Optional, Tuple
 from rich.console import Console
-from rich.table import Table
 
-from kafka_cli.utils.config import get_config, get_config_dir
+from kafka_cli.utils.config import resolve_and_load_profile, save_profile_addons
 from kafka_cli.utils.interactive import safe_typer_confirm, safe_select, safe_text
 
 app = typer.Typer(help="Manage Kafka cluster add-ons")
@@ -21,6 +18,26 @@ class AddonType(str, Enum):
     SCHEMA_REGISTRY = "schema-registry"
 
 
+# Profile key for each add-on type
+_ADDON_KEYS = {addon: addon.value.replace("-", "_") for addon in AddonType}
+
+# Available add-ons as (display name, profile key, default port)
+_ADDONS: Tuple[Tuple[str, str, int], ...] = (
+    ("Kafka UI", "kafka_ui", 8080),
+    ("Prometheus", "prometheus", 9090),
+    ("Kafka Exporter", "kafka_exporter", 9308),
+    ("Grafana", "grafana", 3000),
+    ("Schema Registry", "schema_registry", 8081),
+)
+
+# Dummy add-on URL templates per deployment target
+_ADDON_URL_TEMPLATES = {
+    "GCP Cloud Run": "https://{key}-{profile}.run.app",
+    "GCP Compute Engine VM": "http://addon-vm-{profile}.example.com:{port}",
+    "Existing Kubernetes Cluster": "http://{key}.{profile}.svc.cluster.local:{port}",
+}
+
+
 @app.command("list")
 def list_addons(
     profile_name: Optional[str] = typer.Option(
@@ -28,63 +45,35 @@ def list_addons(
     ),
 ):
     """List all available and installed add-ons for a cluster"""
-    # Determine which profile to use
-    config = get_config()
-    if not profile_name:
-        profile_name = config.get("default_profile")
-        
-    if not profile_name:
-        console.print("No profile specified and no default profile set", style="red")
-        return
-    
-    profile_path = os.path.join(get_config_dir(), "profiles", f"{profile_name}.yaml")
-    if not os.path.exists(profile_path):
-        console.print(f"Profile [bold red]{profile_name}[/bold red] not found", style="red")
-        return
+    from rich.table import Table
     
-    # Load the profile
-    try:
-        with open(profile_path, 'r') as f:
-            profile = yaml.safe_load(f)
-    except Exception as e:
-        console.print(f"Error reading profile: {str(e)}", style="red")
+    # Resolve and load the profile
+    resolved = resolve_and_load_profile(profile_name)
+    if resolved is None:
         return
+    profile_name, _, profile = resolved
     
     # Get the addons configuration
     addons = profile.get("addons", {})
     
+    # Add-on URLs will depend on the deployment target
+    url_template = _ADDON_URL_TEMPLATES.get(addons.get("deployment_target", "Unknown"))
+    
+    # Build every row up front, with a dummy URL for installed add-ons
+    rows = [
+        (name, "Installed", url_template.format(key=key, profile=profile_name, port=port) if url_template else "")
+        if addons.get(key)
+        else (name, "Not Installed", "N/A")
+        for name, key, port in _ADDONS
+    ]
+    
     # Create a table to display the add-ons
     table = Table(title=f"Add-ons for Profile: {profile_name}")
     table.add_column("Add-on", style="cyan")
     table.add_column("Status", style="green")
     table.add_column("URL", style="blue")
-    
-    # Available add-ons
-    addon_list = [
-        {"name": "Kafka UI", "key": "kafka_ui", "default_port": 8080},
-        {"name": "Prometheus", "key": "prometheus", "default_port": 9090},
-        {"name": "Kafka Exporter", "key": "kafka_exporter", "default_port": 9308},
-        {"name": "Grafana", "key": "grafana", "default_port": 3000},
-        {"name": "Schema Registry", "key": "schema_registry", "default_port": 8081},
-    ]
-    
-    # Add-on URLs will depend on the deployment target
-    deployment_target = addons.get("deployment_target", "Unknown")
-    
-    for addon in addon_list:
-        status = "Installed" if addons.get(addon["key"]) else "Not Installed"
-        
-        # Generate a dummy URL for installed add-ons
-        url = ""
-        if addons.get(addon["key"]):
-            if deployment_target == "GCP Cloud Run":
-                url = f"https://{addon['key']}-{profile_name}.run.app"
-            elif deployment_target == "GCP Compute Engine VM":
-                url = f"http://addon-vm-{profile_name}.example.com:{addon['default_port']}"
-            elif deployment_target == "Existing Kubernetes Cluster":
-                url = f"http://{addon['key']}.{profile_name}.svc.cluster.local:{addon['default_port']}"
-        
-        table.add_row(addon["name"], status, url if addons.get(addon["key"]) else "N/A")
+    for row in rows:
+        table.add_row(*row)
     
     console.print(table)
 
@@ -100,33 +89,17 @@ def install_addon(
     ),
 ):
     """Install an add-on to a Kafka cluster"""
-    # Determine which profile to use
-    config = get_config()
-    if not profile_name:
-        profile_name = config.get("default_profile")
-        
-    if not profile_name:
-        console.print("No profile specified and no default profile set", style="red")
-        return
-    
-    profile_path = os.path.join(get_config_dir(), "profiles", f"{profile_name}.yaml")
-    if not os.path.exists(profile_path):
-        console.print(f"Profile [bold red]{profile_name}[/bold red] not found", style="red")
-        return
-    
-    # Load the profile
-    try:
-        with open(profile_path, 'r') as f:
-            profile = yaml.safe_load(f)
-    except Exception as e:
-        console.print(f"Error reading profile: {str(e)}", style="red")
+    # Resolve and load the profile
+    resolved = resolve_and_load_profile(profile_name)
+    if resolved is None:
         return
+    profile_name, profile_path, profile = resolved
     
     # Get the addons configuration
     addons = profile.get("addons", {})
     
     # Convert addon type enum to profile key
-    addon_key = addon.value.replace("-", "_")
+    addon_key = _ADDON_KEYS[addon]
     
     # Check if addon is already installed
     if addons.get(addon_key):
@@ -157,12 +130,10 @@ def install_addon(
     
     # Update the profile with the new addon
     addons[addon_key] = True
-    profile["addons"] = addons
     
-    # Save the updated profile
+    # Save the updated add-on state
     try:
-        with open(profile_path, 'w') as f:
-            yaml.dump(profile, f, default_flow_style=False)
+        save_profile_addons(profile_path, addons)
         console.print(f"✅ Add-on [bold cyan]{addon.value}[/bold cyan] installed successfully")
     except Exception as e:
         console.print(f"Error saving profile: {str(e)}", style="red")
@@ -179,33 +150,17 @@ def uninstall_addon(
     ),
 ):
     """Uninstall an add-on from a Kafka cluster"""
-    # Determine which profile to use
-    config = get_config()
-    if not profile_name:
-        profile_name = config.get("default_profile")
-        
-    if not profile_name:
-        console.print("No profile specified and no default profile set", style="red")
-        return
-    
-    profile_path = os.path.join(get_config_dir(), "profiles", f"{profile_name}.yaml")
-    if not os.path.exists(profile_path):
-        console.print(f"Profile [bold red]{profile_name}[/bold red] not found", style="red")
-        return
-    
-    # Load the profile
-    try:
-        with open(profile_path, 'r') as f:
-            profile = yaml.safe_load(f)
-    except Exception as e:
-        console.print(f"Error reading profile: {str(e)}", style="red")
+    # Resolve and load the profile
+    resolved = resolve_and_load_profile(profile_name)
+    if resolved is None:
         return
+    profile_name, profile_path, profile = resolved
     
     # Get the addons configuration
     addons = profile.get("addons", {})
     
     # Convert addon type enum to profile key
-    addon_key = addon.value.replace("-", "_")
+    addon_key = _ADDON_KEYS[addon]
     
     # Check if addon is installed
     if not addons.get(addon_key):
@@ -224,12 +179,10 @@ def uninstall_addon(
     
     # Update the profile to remove the addon
     addons[addon_key] = False
-    profile["addons"] = addons
     
-    # Save the updated profile
+    # Save the updated add-on state
     try:
-        with open(profile_path, 'w') as f:
-            yaml.dump(profile, f, default_flow_style=False)
+        save_profile_addons(profile_path, addons)
         console.print(f"✅ Add-on [bold cyan]{addon.value}[/bold cyan] uninstalled successfully")
     except Exception as e:
         console.print(f"Error saving profile: {str(e)}", style="red")
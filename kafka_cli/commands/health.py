@@ -1,14 +1,19 @@
-import os
 import typer
-import yaml
 from typing import Optional
 from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress
 
 app = typer.Typer(help="Check the health of Kafka clusters and components")
 console = Console()
 
+# Simulated add-on health results as (profile key, display name, message, URL)
+_HEALTH_ADDONS = (
+    ("kafka_ui", "Kafka UI", "Service is running", "https://kafka-ui.example.com"),
+    ("prometheus", "Prometheus", "Service is running", "https://prometheus.example.com"),
+    ("kafka_exporter", "Kafka Exporter", "Service is running and collecting metrics", None),
+    ("grafana", "Grafana", "Service is running", "https://grafana.example.com"),
+    ("schema_registry", "Schema Registry", "Service is running", "https://schema-registry.example.com"),
+)
+
 
 @app.command("check")
 def check_health(
@@ -26,56 +31,55 @@ def check_health(
     ),
 ):
     """Check the health of a Kafka cluster and its components"""
-    from kafka_cli.utils.config import get_config, get_config_dir
+    from rich.progress import Progress
+    from rich.table import Table
     
-    # Determine which profile to use
-    config = get_config()
-    if not profile_name:
-        profile_name = config.get("default_profile")
-        
-    if not profile_name:
-        console.print("No profile specified and no default profile set", style="red")
-        return
+    from kafka_cli.utils.config import resolve_and_load_profile
     
-    profile_path = os.path.join(get_config_dir(), "profiles", f"{profile_name}.yaml")
-    if not os.path.exists(profile_path):
-        console.print(f"Profile [bold red]{profile_name}[/bold red] not found", style="red")
-        return
-    
-    # Load the profile
-    try:
-        with open(profile_path, 'r') as f:
-            profile = yaml.safe_load(f)
-    except Exception as e:
-        console.print(f"Error reading profile: {str(e)}", style="red")
+    # Resolve and load the profile
+    resolved = resolve_and_load_profile(profile_name)
+    if resolved is None:
         return
+    profile_name, _, profile = resolved
     
     console.print(f"Checking health for profile: [bold cyan]{profile_name}[/bold cyan]")
     
-    # Start the health check process with a progress bar
-    with Progress() as progress:
-        overall_task = progress.add_task("[green]Running health checks...", total=100)
-        
-        # Check infrastructure/network if requested or if checking all components
-        if not component or component.lower() == "network":
-            progress.update(overall_task, advance=10, description="[green]Checking network...")
-            network_status = check_network_health(profile, verbose)
-            progress.update(overall_task, advance=20)
-        
-        # Check Kafka if requested or if checking all components
-        if not component or component.lower() == "kafka":
-            progress.update(overall_task, description="[green]Checking Kafka brokers...")
-            kafka_status = check_kafka_health(profile, verbose)
-            progress.update(overall_task, advance=40)
-        
-        # Check addons if requested or if checking all components
-        if not component or component.lower() == "addons":
-            progress.update(overall_task, description="[green]Checking add-ons...")
-            addons_status = check_addons_health(profile, verbose)
-            progress.update(overall_task, advance=30)
-        
-        # Complete the progress
-        progress.update(overall_task, completed=100)
+    # Select the checks to run for the requested component
+    selected = component.lower() if component else None
+    checks = [
+        (name, label, check)
+        for name, label, check in (
+            ("network", "network", check_network_health),
+            ("kafka", "Kafka brokers", check_kafka_health),
+            ("addons", "add-ons", check_addons_health),
+        )
+        if selected in (None, name)
+    ]
+    
+    if verbose:
+        # Only render a progress bar when detailed output was requested
+        with Progress() as progress:
+            overall_task = progress.add_task("[green]Running health checks...", total=len(checks))
+            results = _run_health_checks(
+                checks,
+                profile,
+                verbose,
+                lambda label: progress.update(overall_task, advance=1, description=f"[green]Checked {label}"),
+            )
+    else:
+        results = _run_health_checks(checks, profile, verbose)
+    
+    # Build every summary row before rendering the table
+    rows = []
+    if "network" in results:
+        rows.append(("Network", results["network"].get("status", "Unknown"), results["network"].get("message", "")))
+    if "kafka" in results:
+        rows.append(("Kafka Brokers", results["kafka"].get("status", "Unknown"), results["kafka"].get("message", "")))
+    if "addons" in results:
+        rows.extend(
+            (f"Addon: {addon}", status.get("status", "Unknown"), status.get("message", ""))
+            for addon, status in results["addons"].items()
+        )
     
     # Display the overall health summary
     console.print("\n[bold]Health Check Summary:[/bold]")
@@ -84,30 +88,36 @@ def check_health(
     table.add_column("Component", style="cyan")
     table.add_column("Status", style="green")
     table.add_column("Details", style="magenta")
+    for row in rows:
+        table.add_row(*row)
     
-    if not component or component.lower() == "network":
-        table.add_row(
-            "Network", 
-            network_status.get("status", "Unknown"),
-            network_status.get("message", "")
-        )
+    console.print(table)
+
+
+def _run_health_checks(checks, profile, verbose, on_complete=None):
+    """Run the selected health checks, concurrently when there is more than one"""
+    from concurrent.futures import ThreadPoolExecutor, as_completed
     
-    if not component or component.lower() == "kafka":
-        table.add_row(
-            "Kafka Brokers", 
-            kafka_status.get("status", "Unknown"),
-            kafka_status.get("message", "")
-        )
+    results = {}
     
-    if not component or component.lower() == "addons":
-        for addon, status in addons_status.items():
-            table.add_row(
-                f"Addon: {addon}", 
-                status.get("status", "Unknown"),
-                status.get("message", "")
-            )
+    # A single component is checked inline, there is nothing to overlap
+    if len(checks) <= 1:
+        for name, label, check in checks:
+            results[name] = check(profile, verbose)
+            if on_complete:
+                on_complete(label)
+        return results
+    
+    # The real checks are independent, network-bound API calls
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = {executor.submit(check, profile, verbose): (name, label) for name, label, check in checks}
+        for future in as_completed(futures):
+            name, label = futures[future]
+            results[name] = future.result()
+            if on_complete:
+                on_complete(label)
     
-    console.print(table)
+    return results
 
 
 def check_network_health(profile, verbose):
@@ -154,44 +164,13 @@ def check_addons_health(profile, verbose):
     addons = profile.get("addons", {})
     results = {}
     
-    # Check Kafka UI if enabled
-    if addons.get("kafka_ui"):
-        results["Kafka UI"] = {
-            "status": "Healthy",
-            "message": "Service is running",
-            "url": "https://kafka-ui.example.com"  # Simulated URL
-        }
-    
-    # Check Prometheus if enabled
-    if addons.get("prometheus"):
-        results["Prometheus"] = {
-            "status": "Healthy",
-            "message": "Service is running",
-            "url": "https://prometheus.example.com"  # Simulated URL
-        }
-    
-    # Check Kafka Exporter if enabled
-    if addons.get("kafka_exporter"):
-        results["Kafka Exporter"] = {
-            "status": "Healthy",
-            "message": "Service is running and collecting metrics"
-        }
-    
-    # Check Grafana if enabled
-    if addons.get("grafana"):
-        results["Grafana"] = {
-            "status": "Healthy",
-            "message": "Service is running",
-            "url": "https://grafana.example.com"  # Simulated URL
-        }
-    
-    # Check Schema Registry if enabled
-    if addons.get("schema_registry"):
-        results["Schema Registry"] = {
-            "status": "Healthy",
-            "message": "Service is running",
-            "url": "https://schema-registry.example.com"  # Simulated URL
-        }
+    for key, name, message, url in _HEALTH_ADDONS:
+        if not addons.get(key):
+            continue
+        result = {"status": "Healthy", "message": message}
+        if url:
+            result["url"] = url
+        results[name] = result
     
     return results
 
@@ -213,21 +192,13 @@ def view_logs(
     ),
 ):
     """View logs for a specific component of the Kafka cluster"""
-    from kafka_cli.utils.config import get_config, get_config_dir
+    from kafka_cli.utils.config import resolve_profile
     
     # Determine which profile to use
-    config = get_config()
-    if not profile_name:
-        profile_name = config.get("default_profile")
-        
-    if not profile_name:
-        console.print("No profile specified and no default profile set", style="red")
-        return
-    
-    profile_path = os.path.join(get_config_dir(), "profiles", f"{profile_name}.yaml")
-    if not os.path.exists(profile_path):
-        console.print(f"Profile [bold red]{profile_name}[/bold red] not found", style="red")
+    resolved = resolve_profile(profile_name)
+    if resolved is None:
         return
+    profile_name, _ = resolved
     
     console.print(f"Fetching {lines} lines of logs for {component} in profile: [bold cyan]{profile_name}[/bold cyan]")
     
@@ -1,28 +1,49 @@
 import os
 import typer
-import yaml
 import datetime
 from typing import List
 from rich.console import Console
-from rich.table import Table
+from rich.markup import escape
 
-from kafka_cli.utils.config import get_config, update_config, get_config_dir
+from kafka_cli.utils.config import (
+    get_config,
+    update_config,
+    get_profile_path,
+    get_profiles_dir,
+    load_profile,
+    remove_profile,
+)
 from kafka_cli.utils.interactive import safe_typer_confirm, check_interactive_or_exit
 
 app = typer.Typer(help="Manage configuration profiles")
 console = Console()
 
+# Plain key/value profile sections shown by "profiles show", in display order
+_PROFILE_SECTIONS = (
+    ("gcp", "GCP"),
+    ("networking", "Networking"),
+    ("kafka", "Kafka"),
+)
+
 
 @app.command("list")
 def list_profiles():
     """List all available configuration profiles"""
-    profiles_dir = os.path.join(get_config_dir(), "profiles")
+    from rich.table import Table
+    
+    profiles_dir = get_profiles_dir()
     
     if not os.path.exists(profiles_dir):
         console.print("Profiles directory not found", style="yellow")
         return
     
-    profiles = [f[:-5] for f in os.listdir(profiles_dir) if f.endswith(".yaml")]
+    # One directory pass; DirEntry caches file type and stat results
+    with os.scandir(profiles_dir) as entries:
+        profiles = [
+            (entry.name[:-5], entry.stat().st_mtime)
+            for entry in entries
+            if entry.name.endswith(".yaml") and entry.is_file()
+        ]
     
     if not profiles:
         console.print("No profiles found", style="yellow")
@@ -36,9 +57,7 @@ def list_profiles():
     table.add_column("Default", style="green")
     table.add_column("Last Modified", style="magenta")
     
-    for profile in sorted(profiles):
-        profile_path = os.path.join(profiles_dir, f"{profile}.yaml")
-        last_modified = os.path.getmtime(profile_path)
+    for profile, last_modified in sorted(profiles):
         last_modified_dt = datetime.datetime.fromtimestamp(last_modified)
         last_modified_str = last_modified_dt.strftime("%Y-%m-%d %H:%M:%S")
         
@@ -53,49 +72,41 @@ def show_profile(
     profile_name: str = typer.Argument(..., help="Name of the profile to display"),
 ):
     """Show the details of a specific profile"""
-    profile_path = os.path.join(get_config_dir(), "profiles", f"{profile_name}.yaml")
-    
-    if not os.path.exists(profile_path):
-        console.print(f"Profile [bold red]{profile_name}[/bold red] not found", style="red")
-        return
-    
     try:
-        with open(profile_path, 'r') as f:
-            profile = yaml.safe_load(f)
-        
-        console.print(f"\n[bold]Profile: [cyan]{profile_name}[/cyan][/bold]")
-        
-        # Display GCP configuration
-        if "gcp" in profile:
-            console.print("\n[bold cyan]GCP Configuration:[/bold cyan]")
-            for key, value in profile["gcp"].items():
-                console.print(f"  {key}: {value}")
+        profile = load_profile(get_profile_path(profile_name))
         
-        # Display networking configuration
-        if "networking" in profile:
-            console.print("\n[bold cyan]Networking Configuration:[/bold cyan]")
-            for key, value in profile["networking"].items():
-                console.print(f"  {key}: {value}")
+        # Collect the whole listing and render it with a single print, escaping profile values so a
+        # stray "[" in one of them can't break the markup of the lines after it
+        lines = [f"\n[bold]Profile: [cyan]{escape(profile_name)}[/cyan][/bold]"]
         
-        # Display Kafka configuration
-        if "kafka" in profile:
-            console.print("\n[bold cyan]Kafka Configuration:[/bold cyan]")
-            for key, value in profile["kafka"].items():
-                console.print(f"  {key}: {value}")
+        # Display GCP, networking and Kafka configuration
+        for section, title in _PROFILE_SECTIONS:
+            data = profile.get(section)
+            if data is not None:
+                lines.append(f"\n[bold cyan]{title} Configuration:[/bold cyan]")
+                for key, value in data.items():
+                    lines.append(f"  {escape(str(key))}: {escape(str(value))}")
         
         # Display add-ons configuration
-        if "addons" in profile:
-            console.print("\n[bold cyan]Add-ons Configuration:[/bold cyan]")
-            for key, value in profile["addons"].items():
-                if key not in ["deployment_target", "kubeconfig_path"]:
-                    console.print(f"  {key}: {'Enabled' if value else 'Disabled'}")
+        addons = profile.get("addons")
+        if addons is not None:
+            lines.append("\n[bold cyan]Add-ons Configuration:[/bold cyan]")
+            for key, value in addons.items():
+                if key not in ("deployment_target", "kubeconfig_path"):
+                    lines.append(f"  {escape(str(key))}: {'Enabled' if value else 'Disabled'}")
             
-            if "deployment_target" in profile["addons"]:
-                console.print(f"  Deployment Target: {profile['addons']['deployment_target']}")
+            deployment_target = addons.get("deployment_target")
+            if deployment_target is not None:
+                lines.append(f"  Deployment Target: {escape(str(deployment_target))}")
             
-            if "kubeconfig_path" in profile["addons"]:
-                console.print(f"  Kubeconfig Path: {profile['addons']['kubeconfig_path']}")
+            kubeconfig_path = addons.get("kubeconfig_path")
+            if kubeconfig_path is not None:
+                lines.append(f"  Kubeconfig Path: {escape(str(kubeconfig_path))}")
         
+        console.print("\n".join(lines))
+        
+    except FileNotFoundError:
+        console.print(f"Profile [bold red]{profile_name}[/bold red] not found", style="red")
     except Exception as e:
         console.print(f"Error reading profile: {str(e)}", style="red")
 
@@ -108,7 +119,7 @@ def create_profile(
     from kafka_cli.commands.start import run_wizard
     
     # Check if profile already exists
-    profile_path = os.path.join(get_config_dir(), "profiles", f"{profile_name}.yaml")
+    profile_path = get_profile_path(profile_name)
     if os.path.exists(profile_path):
         if not safe_typer_confirm(f"Profile {profile_name} already exists. Do you want to overwrite it?"):
             console.print("Profile creation aborted", style="yellow")
@@ -125,8 +136,7 @@ def delete_profile(
     force: bool = typer.Option(False, "--force", "-f", help="Force deletion without confirmation"),
 ):
     """Delete a configuration profile"""
-    profiles_dir = os.path.join(get_config_dir(), "profiles")
-    profile_path = os.path.join(profiles_dir, f"{profile_name}.yaml")
+    profile_path = get_profile_path(profile_name)
     
     if not os.path.exists(profile_path):
         console.print(f"Profile [bold red]{profile_name}[/bold red] not found", style="red")
@@ -145,7 +155,7 @@ def delete_profile(
         return
     
     try:
-        os.remove(profile_path)
+        remove_profile(profile_path)
         console.print(f"Profile [bold cyan]{profile_name}[/bold cyan] deleted successfully")
         
         # If this was the default profile, update the config
@@ -163,7 +173,7 @@ def set_default_profile(
     profile_name: str = typer.Argument(..., help="Name of the profile to set as default"),
 ):
     """Set a profile as the default for commands"""
-    profile_path = os.path.join(get_config_dir(), "profiles", f"{profile_name}.yaml")
+    profile_path = get_profile_path(profile_name)
     
     if not os.path.exists(profile_path):
         console.print(f"Profile [bold red]{profile_name}[/bold red] not found", style="red")
@@ -1,23 +1,14 @@
+import functools
 import os
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional
 
 import typer
-import yaml
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+from rich.markup import escape
 from rich.text import Text
 
-from kafka_cli.utils.config import get_config, get_config_dir, update_config
-from kafka_cli.utils.gcp_auth import (
-    estimate_compute_costs,
-    get_active_project,
-    get_zones_for_region,
-    list_gcp_regions,
-    list_gcp_vpcs,
-    list_security_groups,
-    list_subnets_for_vpc,
-)
+from kafka_cli.utils.config import get_config, get_profile_path, get_profiles_dir, save_profile, update_config
 from kafka_cli.utils.interactive import (
     is_interactive,
     safe_confirm,
@@ -28,17 +19,20 @@ from kafka_cli.utils.interactive import (
     safe_select,
     safe_text,
 )
-from kafka_cli.utils.terraform import generate_terraform_vars
 
 app = typer.Typer(help="Start the interactive Kafka cluster provisioning wizard")
 console = Console()
 
 # Kafka versions to offer
-KAFKA_VERSIONS = ["3.3.1", "3.4.0", "3.4.1", "3.5.0", "3.5.1", "3.6.0"]
+KAFKA_VERSIONS = ("3.3.1", "3.4.0", "3.4.1", "3.5.0", "3.5.1", "3.6.0")
+# Kafka versions offered by the wizard, newest first
+WIZARD_KAFKA_VERSIONS = ("3.5.0", "3.4.1", "3.3.2", "3.2.3", "2.8.1")
+# Ways to size the broker machines
+COMPUTE_APPROACHES = ("Select predefined machine type", "Specify custom CPU and memory")
 # Storage types to offer
-STORAGE_TYPES = ["pd-standard", "pd-balanced", "pd-ssd"]
+STORAGE_TYPES = ("pd-standard", "pd-balanced", "pd-ssd")
 # Machine types mapped to vCPU and memory
-MACHINE_TYPES = {
+MACHINE_TYPES = MappingProxyType({
     "e2-standard-2": {"vCPU": 2, "RAM": 8},
     "e2-standard-4": {"vCPU": 4, "RAM": 16},
     "e2-standard-8": {"vCPU": 8, "RAM": 32},
@@ -47,10 +41,43 @@ MACHINE_TYPES = {
     "n2-standard-4": {"vCPU": 4, "RAM": 16},
     "n2-standard-8": {"vCPU": 8, "RAM": 32},
     "n2-standard-16": {"vCPU": 16, "RAM": 64},
-}
+})
 
 # Authentication methods
-AUTH_METHODS = ["none", "ssl"]
+AUTH_METHODS = ("none", "ssl")
+# Sources of the TLS certificates
+TLS_METHODS = ("auto-generate", "upload")
+# Broker instance types offered by the wizard, keyed by their display string
+INSTANCE_TYPE_CHOICES = MappingProxyType({
+    display: display.split(" ", 1)[0]
+    for display in (
+        "e2-standard-2 (2 vCPU, 8GB)",
+        "e2-standard-4 (4 vCPU, 16GB)",
+        "e2-standard-8 (8 vCPU, 32GB)",
+        "n2-standard-2 (2 vCPU, 8GB)",
+        "n2-standard-4 (4 vCPU, 16GB)",
+        "n2-standard-8 (8 vCPU, 32GB)",
+        "n2-standard-16 (16 vCPU, 64GB)",
+        "e2-highmem-2 (2 vCPU, 16GB)",
+        "e2-highmem-4 (4 vCPU, 32GB)",
+        "e2-highcpu-4 (4 vCPU, 4GB)",
+        "e2-highcpu-8 (8 vCPU, 8GB)",
+    )
+})
+
+# Titles of the wizard steps that print a header
+STEP_TITLES = MappingProxyType({
+    1: "Checking GCP Authentication",
+    2: "GCP Configuration Selection",
+    3: "Terraform Backend Configuration",
+    5: "Kafka Cluster Configuration",
+})
+
+
+@functools.lru_cache(maxsize=None)
+def _step_header(step: int) -> Text:
+    """Wizard step header, parsed from markup on first use and reused afterwards"""
+    return Text.from_markup(f"\n[bold cyan]Step {step}:[/bold cyan] [bold]{STEP_TITLES[step]}[/bold]")
 
 
 @app.callback(invoke_without_command=True)
@@ -83,7 +110,7 @@ def main(
                 dry_run=dry_run,
                 project_id=project_id,
                 region=region,
-                zone=zone or f"{region}-a",
+                zone=zone,
                 network_range=network_range,
                 broker_count=broker_count,
                 broker_machine_type=broker_machine_type,
@@ -101,7 +128,7 @@ def run_non_interactive(
     dry_run: bool = False,
     project_id: Optional[str] = None,
     region: str = "us-central1",
-    zone: str = None,
+    zone: Optional[str] = None,
     network_range: str = "10.0.0.0/16",
     broker_count: int = 3,
     broker_machine_type: str = "e2-standard-2",
@@ -113,12 +140,14 @@ def run_non_interactive(
     """
     Run the configuration wizard in non-interactive mode using provided parameters
     """
+    from kafka_cli.utils.terraform import generate_terraform_vars
+
     if not project_id:
         console.print("[bold red]Error:[/bold red] project_id is required in non-interactive mode", style="red")
         console.print("Use --project-id to specify your GCP project ID")
         raise typer.Exit(1)
 
-    # Build configuration from provided parameters
+    # Build configuration from provided parameters, the zone defaults to the region's first
     config = {
         "gcp": {
             "project_id": project_id,
@@ -165,29 +194,36 @@ def run_non_interactive(
         raise typer.Exit(1)
 
 
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(path: str) -> str:
+    """Create a directory once per process, skipping the check on later calls"""
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
 def save_profile_to_file(config: Dict[str, Any], profile_name: str, set_as_default: bool = False):
     """Save configuration as a named profile"""
     try:
         # Ensure profiles directory exists
-        profiles_dir = os.path.join(get_config_dir(), "profiles")
-        os.makedirs(profiles_dir, exist_ok=True)
+        _ensure_dir(get_profiles_dir())
 
         # Save the profile
-        profile_path = os.path.join(profiles_dir, f"{profile_name}.yaml")
-
-        # Check if profile exists
-        if os.path.exists(profile_path):
-            console.print(f"Profile [bold yellow]{profile_name}[/bold yellow] already exists and will be overwritten")
+        profile_path = get_profile_path(profile_name)
 
-        # Write the configuration
-        with open(profile_path, "w") as f:
-            yaml.dump(config, f, default_flow_style=False)
-
-        console.print(f"Configuration saved as profile: [bold cyan]{profile_name}[/bold cyan]")
-
-        # Handle default profile setting
-        if set_as_default or (is_interactive() and safe_confirm("Set this as the default profile?", default=False)):
-            global_config = get_config()
+        # Write the configuration, unless the profile already holds exactly this
+        replaced = save_profile(profile_path, config)
+        if replaced is None:
+            console.print(f"Profile [bold cyan]{profile_name}[/bold cyan] is already up to date")
+        else:
+            if replaced:
+                console.print(f"Profile [bold yellow]{profile_name}[/bold yellow] already existed and was overwritten")
+            console.print(f"Configuration saved as profile: [bold cyan]{profile_name}[/bold cyan]")
+
+        # Handle default profile setting, nothing to ask or write if it already is the default
+        global_config = get_config()
+        if global_config.get("default_profile") != profile_name and (
+            set_as_default or (is_interactive() and safe_confirm("Set this as the default profile?", default=False))
+        ):
             global_config["default_profile"] = profile_name
             update_config(global_config)
             console.print(f"[bold cyan]{profile_name}[/bold cyan] set as the default profile")
@@ -201,8 +237,11 @@ def save_profile_to_file(config: Dict[str, Any], profile_name: str, set_as_defau
 
 def run_wizard(profile_name: Optional[str] = None, dry_run: bool = False):  # noqa C901
     """Run the interactive Kafka configuration wizard"""
+    from rich.panel import Panel
+
     from kafka_cli.utils.gcp_auth import (
         check_gcp_auth,
+        estimate_compute_costs,
         select_gcp_configuration,
     )
     from kafka_cli.utils.interactive import check_interactive_or_exit, safe_confirm, safe_select, safe_text
@@ -224,20 +263,12 @@ def run_wizard(profile_name: Optional[str] = None, dry_run: bool = False):  # no
         )
     )
 
-    # Initialize configuration dictionary
-    config = {"general": {}, "gcp": {}, "kafka": {}, "networking": {}, "security": {}, "monitoring": {}, "tags": {}}
-
     # Optional profile name
     if not profile_name:
-        use_profile = True
-        if use_profile:
-            profile_name = safe_text("Enter a name for this profile", default="default")
-            config["general"]["profile_name"] = profile_name
-    else:
-        config["general"]["profile_name"] = profile_name
+        profile_name = safe_text("Enter a name for this profile", default="default")
 
     # Step 1: Check GCP Authentication
-    console.print("\n[bold cyan]Step 1:[/bold cyan] [bold]Checking GCP Authentication[/bold]")
+    console.print(_step_header(1))
     authenticated = check_gcp_auth()
 
     if not authenticated:
@@ -246,10 +277,9 @@ def run_wizard(profile_name: Optional[str] = None, dry_run: bool = False):  # no
         console.print("[yellow]Some features will be limited without GCP authentication.[/yellow]")
         # Set a default project ID
         project_id = "mock-project"
-        config["gcp"]["project_id"] = project_id
     else:
         # Step 2: GCP Configuration Selection
-        console.print("\n[bold cyan]Step 2:[/bold cyan] [bold]GCP Configuration Selection[/bold]")
+        console.print(_step_header(2))
         console.print("[grey]Select which GCP configuration to use for this deployment.[/grey]")
 
         # Let user select a GCP configuration
@@ -258,12 +288,11 @@ def run_wizard(profile_name: Optional[str] = None, dry_run: bool = False):  # no
         if not project_id:
             project_id = safe_text("Enter your GCP Project ID manually", default="my-project")
 
-        config["gcp"]["project_id"] = project_id
         console.print(f"[bold green]Using GCP Project:[/bold green] {project_id}")
 
     # Terraform Backend Setup - will be skipped if not authenticated
     if authenticated:
-        console.print("\n[bold cyan]Step 3:[/bold cyan] [bold]Terraform Backend Configuration[/bold]")
+        console.print(_step_header(3))
         console.print("[grey]Terraform uses a backend to store state files.[/grey]")
 
         use_remote = safe_confirm("Would you like to use a remote backend (GCS bucket) for Terraform state?", default=True)
@@ -271,7 +300,7 @@ def run_wizard(profile_name: Optional[str] = None, dry_run: bool = False):  # no
             bucket_name = safe_text("Enter the GCS bucket name for Terraform state", default=f"terraform-state-{project_id}")
             prefix = safe_text("Enter a prefix for state files", default="kafka")
 
-            config["terraform"] = {"backend_type": "gcs", "bucket": bucket_name, "prefix": prefix}
+            terraform_config = {"backend_type": "gcs", "bucket": bucket_name, "prefix": prefix}
 
             # Initialize the backend if authenticated
             from kafka_cli.utils.gcp_auth import init_terraform_backend
@@ -279,65 +308,49 @@ def run_wizard(profile_name: Optional[str] = None, dry_run: bool = False):  # no
             init_terraform_backend(bucket_name, prefix)
         else:
             console.print("[yellow]Using local Terraform state storage.[/yellow]")
-            config["terraform"] = {"backend_type": "local"}
+            terraform_config = {"backend_type": "local"}
     else:
         # Default to local backend if not authenticated
         console.print("[yellow]Using local Terraform state storage since GCP is not authenticated.[/yellow]")
-        config["terraform"] = {"backend_type": "local"}
+        terraform_config = {"backend_type": "local"}
 
     # Step 4: Configure GCP settings
-    config["gcp"] = configure_gcp()
+    gcp_config = configure_gcp()
 
     # Step 5: Kafka Settings
-    console.print("\n[bold cyan]Step 5:[/bold cyan] [bold]Kafka Cluster Configuration[/bold]")
+    console.print(_step_header(5))
 
     # Cluster name
     cluster_name = safe_text("Enter a name for your Kafka cluster", default="kafka-cluster")
-    config["kafka"]["cluster_name"] = cluster_name
+    kafka_config = {"cluster_name": cluster_name}
 
     # Kafka version
-    kafka_versions = ["3.5.0", "3.4.1", "3.3.2", "3.2.3", "2.8.1"]
-    kafka_version = safe_select("Select Kafka version", choices=kafka_versions, default="3.5.0")
-    config["kafka"]["version"] = kafka_version
+    kafka_version = safe_select("Select Kafka version", choices=WIZARD_KAFKA_VERSIONS, default=WIZARD_KAFKA_VERSIONS[0])
+    kafka_config["version"] = kafka_version
 
     # Cluster size
     broker_count = safe_number("Number of Kafka brokers", min_value=1, max_value=20, default=3)
-    config["kafka"]["broker_count"] = broker_count
+    kafka_config["broker_count"] = broker_count
 
     # Instance type selection approach
     compute_type_approach = safe_select(
         "How would you like to configure compute resources?",
-        choices=["Select predefined machine type", "Specify custom CPU and memory"],
-        default="Select predefined machine type",
+        choices=COMPUTE_APPROACHES,
+        default=COMPUTE_APPROACHES[0],
     )
 
-    if compute_type_approach == "Select predefined machine type":
-        # Instance type options
-        instance_types = [
-            "e2-standard-2 (2 vCPU, 8GB)",
-            "e2-standard-4 (4 vCPU, 16GB)",
-            "e2-standard-8 (8 vCPU, 32GB)",
-            "n2-standard-2 (2 vCPU, 8GB)",
-            "n2-standard-4 (4 vCPU, 16GB)",
-            "n2-standard-8 (8 vCPU, 32GB)",
-            "n2-standard-16 (16 vCPU, 64GB)",
-            "e2-highmem-2 (2 vCPU, 16GB)",
-            "e2-highmem-4 (4 vCPU, 32GB)",
-            "e2-highcpu-4 (4 vCPU, 4GB)",
-            "e2-highcpu-8 (8 vCPU, 8GB)",
-        ]
-
+    if compute_type_approach == COMPUTE_APPROACHES[0]:
         machine_type_display = safe_select(
             "Select machine type for Kafka brokers",
-            choices=instance_types,
+            choices=list(INSTANCE_TYPE_CHOICES),
             default="e2-standard-4 (4 vCPU, 16GB)",
             help_text="Larger instances provide better performance but cost more.",
         )
 
-        # Extract the actual machine type from the display string
-        machine_type = machine_type_display.split(" ")[0]
-        config["kafka"]["machine_type"] = machine_type
-        config["kafka"]["custom_machine"] = False
+        # Look up the actual machine type for the display string
+        machine_type = INSTANCE_TYPE_CHOICES[machine_type_display]
+        kafka_config["machine_type"] = machine_type
+        kafka_config["custom_machine"] = False
 
         console.print(f"[bold green]Selected machine type:[/bold green] {machine_type}")
 
@@ -348,52 +361,63 @@ def run_wizard(profile_name: Optional[str] = None, dry_run: bool = False):  # no
         memory_gb = safe_number("Memory (GB) per broker", min_value=1, max_value=624, default=16)
 
         # Create a custom machine type name
-        config["kafka"]["custom_machine"] = True
-        config["kafka"]["custom_cpu"] = vcpu_count
-        config["kafka"]["custom_memory_gb"] = memory_gb
+        kafka_config["custom_machine"] = True
+        kafka_config["custom_cpu"] = vcpu_count
+        kafka_config["custom_memory_gb"] = memory_gb
 
         # Store as e2-custom-{cpu}-{memory} format for Terraform variables
         custom_machine_type = f"custom-{vcpu_count}-{memory_gb*1024}"
-        config["kafka"]["machine_type"] = custom_machine_type
+        kafka_config["machine_type"] = custom_machine_type
 
         console.print(f"[bold green]Custom machine configuration:[/bold green] {vcpu_count} vCPUs, {memory_gb} GB memory")
 
     # Disk configuration
-    disk_types = ["pd-standard", "pd-balanced", "pd-ssd"]
     disk_type = safe_select(
         "Select disk type",
-        choices=disk_types,
+        choices=STORAGE_TYPES,
         default="pd-ssd",
         help_text="SSD provides better performance, standard is more economical.",
     )
-    config["kafka"]["disk_type"] = disk_type
+    kafka_config["disk_type"] = disk_type
 
     disk_size_gb = safe_number("Disk size (GB) for each broker", min_value=10, max_value=65536, default=100)
-    config["kafka"]["disk_size_gb"] = disk_size_gb
+    kafka_config["disk_size_gb"] = disk_size_gb
 
     # Step 6: Configure networking
-    config["networking"] = configure_networking(config["gcp"]["region"])
+    networking_config = configure_networking(gcp_config["region"])
 
     # Step 7: Configure additional options
-    config["auth"] = configure_auth()
+    auth_config = configure_auth()
 
     # Step 8: Configure monitoring and addons
-    config["monitoring"] = configure_monitoring()
+    monitoring_config = configure_monitoring()
 
     # Step 9: Configure labels/tags
-    config["labels"] = configure_labels()
+    labels_config = configure_labels()
 
     # Calculate estimated costs if enabled
-    if "compute_estimate" in config["kafka"] and config["kafka"]["compute_estimate"]:
+    if kafka_config.get("compute_estimate"):
         estimated_costs = estimate_compute_costs(
-            region=config["gcp"]["region"],
-            instance_type=config["kafka"]["machine_type"],
-            num_instances=config["kafka"]["broker_count"],
-            disk_type=config["kafka"]["storage_type"],
-            disk_size_gb=config["kafka"]["storage_size"],
+            region=gcp_config["region"],
+            instance_type=kafka_config["machine_type"],
+            num_instances=kafka_config["broker_count"],
+            disk_type=kafka_config["storage_type"],
+            disk_size_gb=kafka_config["storage_size"],
         )
         if estimated_costs:
-            config["kafka"]["estimated_costs"] = estimated_costs
+            kafka_config["estimated_costs"] = estimated_costs
+
+    # Assemble the full configuration
+    config = {
+        "general": {"profile_name": profile_name},
+        "gcp": gcp_config,
+        "terraform": terraform_config,
+        "kafka": kafka_config,
+        "networking": networking_config,
+        "auth": auth_config,
+        "monitoring": monitoring_config,
+        "labels": labels_config,
+    }
 
     # Display configuration summary
     console.print("\n[bold]Configuration Summary:[/bold]")
@@ -411,11 +435,10 @@ def run_wizard(profile_name: Optional[str] = None, dry_run: bool = False):  # no
         console.print("[bold red]Deployment canceled.[/bold red]")
         raise typer.Abort()
 
-    # Save configuration as profile if requested
-    if "profile_name" in config["general"]:
-        profile_saved = save_profile_to_file(config, config["general"]["profile_name"])
-        if profile_saved:
-            console.print(f"[bold green]Configuration saved as profile '{config['general']['profile_name']}'[/bold green]")
+    # Save configuration under the wizard's profile name
+    profile_name = config["general"]["profile_name"]
+    if save_profile_to_file(config, profile_name):
+        console.print(f"[bold green]Configuration saved as profile '{profile_name}'[/bold green]")
 
     # Generate Terraform variables
     if generate_terraform_vars(config, dry_run):
@@ -430,6 +453,8 @@ def run_wizard(profile_name: Optional[str] = None, dry_run: bool = False):  # no
 
 def configure_gcp() -> Dict[str, Any]:
     """Configure GCP settings"""
+    from kafka_cli.utils.gcp_auth import get_active_project, get_zones_for_region, list_gcp_regions
+
     console.print("\n[bold cyan]GCP Configuration[/bold cyan]")
 
     # Get active project
@@ -450,10 +475,25 @@ def configure_gcp() -> Dict[str, Any]:
 
 def configure_networking(region: str) -> Dict[str, Any]:
     """Configure networking settings"""
+    import ipaddress
+    from concurrent.futures import ThreadPoolExecutor
+
+    from kafka_cli.utils.gcp_auth import list_gcp_vpcs, list_security_groups, list_subnets_for_vpc
+
     console.print("\n[bold cyan]Networking Configuration[/bold cyan]")
 
+    # The VPC and firewall rule lookups are independent, fetch them together
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        vpcs_future = executor.submit(list_gcp_vpcs)
+        firewall_rules_future = executor.submit(list_security_groups)
+        vpcs = vpcs_future.result()
+        firewall_rules = firewall_rules_future.result()
+
+    # Only a new VPC gets a custom network CIDR, and only a new subnet a subnet CIDR
+    network_cidr = "10.0.0.0/16"
+    subnet_cidr: Optional[str] = None
+
     # Get existing VPCs
-    vpcs = list_gcp_vpcs()
     vpc_names = [vpc["name"] for vpc in vpcs] + ["Create new VPC"]
 
     vpc_selection = safe_select("Select VPC network:", choices=vpc_names, default="Create new VPC")
@@ -469,16 +509,20 @@ def configure_networking(region: str) -> Dict[str, Any]:
 
         # Get existing subnets for the selected VPC
         subnets = list_subnets_for_vpc(vpc_name)
-        # Filter subnets by region
-        region_subnets = [subnet for subnet in subnets if region in subnet.get("region", "")]
+        # Index subnets by region name (gcloud reports the region as a URL)
+        subnets_by_region: Dict[str, List[Dict[str, Any]]] = {}
+        for subnet in subnets:
+            subnets_by_region.setdefault(subnet.get("region", "").rpartition("/")[2], []).append(subnet)
+        region_subnets = subnets_by_region.get(region, [])
 
         if region_subnets:
-            subnet_choices = [f"{subnet['name']} ({subnet['ipCidrRange']})" for subnet in region_subnets]
+            subnet_choices = {f"{subnet['name']} ({subnet['ipCidrRange']})": subnet["name"] for subnet in region_subnets}
+            choices = list(subnet_choices)
             selected_subnet_names = safe_multiselect(
-                f"Select subnets in {region}:", choices=subnet_choices, default=[subnet_choices[0]] if subnet_choices else []
+                f"Select subnets in {region}:", choices=choices, default=[choices[0]] if choices else []
             )
-            # Extract just the subnet names from the display string
-            selected_subnets = [name.split(" ")[0] for name in selected_subnet_names]
+            # Map the display strings back to subnet names
+            selected_subnets = [subnet_choices[name] for name in selected_subnet_names]
         else:
             console.print(f"[yellow]No existing subnets found in {region} for VPC {vpc_name}[/yellow]")
             subnet_name = safe_text(f"Enter name for new subnet in {region}:", default=f"kafka-subnet-{region}")
@@ -486,13 +530,12 @@ def configure_networking(region: str) -> Dict[str, Any]:
             selected_subnets = [subnet_name]
             create_new_vpc = True  # We'll need to create the subnet
 
-    # Get security groups (firewall rules in GCP)
-    firewall_rules = list_security_groups()
+    # Offer security groups (firewall rules in GCP)
     if firewall_rules:
-        sg_choices = [f"{rule['name']} ({rule.get('description', 'No description')})" for rule in firewall_rules]
-        selected_sg_names = safe_multiselect("Select firewall rules (security groups):", choices=sg_choices, default=[])
-        # Extract just the rule names from the display string
-        selected_sgs = [name.split(" ")[0] for name in selected_sg_names]
+        sg_choices = {f"{rule['name']} ({rule.get('description', 'No description')})": rule["name"] for rule in firewall_rules}
+        selected_sg_names = safe_multiselect("Select firewall rules (security groups):", choices=list(sg_choices), default=[])
+        # Map the display strings back to rule names
+        selected_sgs = [sg_choices[name] for name in selected_sg_names]
     else:
         selected_sgs = []
 
@@ -500,16 +543,28 @@ def configure_networking(region: str) -> Dict[str, Any]:
     client_cidrs = safe_text(
         "Enter client CIDR allowlist (one per line, leave blank to allow all):", multiline=True, default="0.0.0.0/0"
     )
-    client_cidr_list = [cidr.strip() for cidr in client_cidrs.split("\n") if cidr.strip()]
-
-    return {
+    client_cidr_list = []
+    for cidr in filter(None, map(str.strip, client_cidrs.splitlines())):
+        # Drop malformed entries now rather than failing later in Terraform
+        try:
+            ipaddress.ip_network(cidr, strict=False)
+        except ValueError:
+            console.print(f"[yellow]Ignoring invalid CIDR block: {cidr}[/yellow]")
+            continue
+        client_cidr_list.append(cidr)
+
+    networking = {
         "vpc_name": vpc_name,
         "create_new_vpc": create_new_vpc,
-        "network_cidr": network_cidr if "network_cidr" in locals() else "10.0.0.0/16",
+        "network_cidr": network_cidr,
         "subnets": selected_subnets,
         "security_groups": selected_sgs,
         "client_cidr_allowlist": client_cidr_list,
     }
+    # Without a new subnet generate_terraform_vars falls back to the default subnet CIDR
+    if subnet_cidr is not None:
+        networking["subnet_cidr"] = subnet_cidr
+    return networking
 
 
 def configure_kafka() -> Dict[str, Any]:
@@ -534,19 +589,17 @@ def configure_kafka() -> Dict[str, Any]:
 
     ram_gb = safe_number("Enter RAM per broker (GB):", min_value=2, max_value=256, default=16)
 
-    # Find the closest machine type based on vCPU and RAM
-    suitable_machines = []
-    for machine, specs in MACHINE_TYPES.items():
-        if specs["vCPU"] >= vcpu_count and specs["RAM"] >= ram_gb:
-            suitable_machines.append((machine, specs))
-
-    if suitable_machines:
-        # Sort by closest match (least excess resources)
-        suitable_machines.sort(key=lambda x: (x[1]["vCPU"] - vcpu_count) + (x[1]["RAM"] - ram_gb))
-        machine_type = suitable_machines[0][0]
-    else:
+    # Find the closest machine type (least excess resources) in a single pass
+    machine_type = min(
+        (
+            machine
+            for machine, specs in MACHINE_TYPES.items()
+            if specs["vCPU"] >= vcpu_count and specs["RAM"] >= ram_gb
+        ),
+        key=lambda machine: (MACHINE_TYPES[machine]["vCPU"] - vcpu_count) + (MACHINE_TYPES[machine]["RAM"] - ram_gb),
         # Use the largest if no suitable match
-        machine_type = "n2-standard-16"
+        default="n2-standard-16",
+    )
 
     # Storage type
     storage_type = safe_select("Select storage type:", choices=STORAGE_TYPES, default="pd-ssd")
@@ -591,7 +644,7 @@ def configure_auth() -> Dict[str, Any]:
 
     if auth_method == "ssl":
         # TLS certificate option
-        tls_method = safe_select("TLS certificates:", choices=["auto-generate", "upload"], default="auto-generate")
+        tls_method = safe_select("TLS certificates:", choices=TLS_METHODS, default=TLS_METHODS[0])
 
         tls_config["method"] = tls_method
 
@@ -637,9 +690,21 @@ def configure_labels() -> Dict[str, Any]:
     """Configure labels/tags"""
     console.print("\n[bold cyan]Labels/Tags Configuration[/bold cyan]")
 
+    # Accept all labels in one prompt, falling back to one at a time when left blank
+    bulk = safe_text("Enter labels as key=value, one per line (leave blank to add them one by one):", multiline=True, default="")
     labels = {}
-    add_more = True
+    for line in filter(None, map(str.strip, (bulk or "").splitlines())):
+        key, sep, value = line.partition("=")
+        if not sep or not key.strip():
+            console.print(f"[yellow]Ignoring invalid label line: {escape(line)}[/yellow]")
+            continue
+        labels[key.strip()] = value.strip()
+    if labels:
+        return labels
+    if bulk and bulk.strip():
+        console.print("[yellow]No valid key=value labels entered, adding them one by one instead.[/yellow]")
 
+    add_more = True
     while add_more:
         key = safe_text("Enter label/tag key (or press Enter to finish):", default="")
         if not key:
@@ -654,38 +719,53 @@ def configure_labels() -> Dict[str, Any]:
     return labels
 
 
+@functools.lru_cache(maxsize=None)
+def _setting_label(key: str) -> str:
+    """Turn a configuration key into its summary table label"""
+    return key.replace("_", " ").title()
+
+
 def display_summary(config: Dict[str, Any]):  # noqa C901
     """Display configuration summary"""
+    from rich.console import Group
+    from rich.table import Table
+
+    # Tables are collected and rendered together at the end
+    tables = []
+
     # GCP section
-    if "gcp" in config:
+    gcp = config.get("gcp")
+    if gcp is not None:
         gcp_table = Table(title="GCP Configuration")
         gcp_table.add_column("Setting", style="cyan")
         gcp_table.add_column("Value")
 
-        gcp_table.add_row("Project ID", config["gcp"].get("project_id", "Not specified"))
-        gcp_table.add_row("Region", config["gcp"].get("region", "Not specified"))
+        gcp_table.add_row("Project ID", gcp.get("project_id", "Not specified"))
+        gcp_table.add_row("Region", gcp.get("region", "Not specified"))
 
-        zones = config["gcp"].get("zones", [])
+        zones = gcp.get("zones")
         if zones:
             gcp_table.add_row("Availability Zones", ", ".join(zones))
 
-        console.print(gcp_table)
+        tables.append(gcp_table)
 
     # Kafka section
-    if "kafka" in config:
+    kafka = config.get("kafka")
+    if kafka is not None:
         kafka_table = Table(title="Kafka Configuration")
         kafka_table.add_column("Setting", style="cyan")
         kafka_table.add_column("Value")
 
-        for key, value in config["kafka"].items():
+        add_row = kafka_table.add_row
+        for key, value in kafka.items():
             if key != "estimated_costs":  # Skip costs, will show separately
-                kafka_table.add_row(key.replace("_", " ").title(), str(value))
+                add_row(_setting_label(key), str(value))
 
-        console.print(kafka_table)
+        tables.append(kafka_table)
 
         # Show cost estimation if available
-        if "estimated_costs" in config["kafka"]:
-            costs = config["kafka"]["estimated_costs"]
+        costs = kafka.get("estimated_costs")
+        if costs is not None:
             cost_table = Table(title="Estimated Monthly Costs")
             cost_table.add_column("Item", style="cyan")
             cost_table.add_column("Cost (USD)")
@@ -694,72 +774,85 @@ def display_summary(config: Dict[str, Any]):  # noqa C901
             cost_table.add_row("Per Storage", f"${costs['disk_monthly_per_node']}")
             cost_table.add_row("Total (all nodes)", f"${costs['total_monthly']}")
 
-            console.print(cost_table)
+            tables.append(cost_table)
 
     # Networking section
-    if "networking" in config:
+    networking = config.get("networking")
+    if networking is not None:
         network_table = Table(title="Network Configuration")
         network_table.add_column("Setting", style="cyan")
         network_table.add_column("Value")
 
-        for key, value in config["networking"].items():
-            if isinstance(value, list):
-                network_table.add_row(key.replace("_", " ").title(), ", ".join(value))
-            else:
-                network_table.add_row(key.replace("_", " ").title(), str(value))
+        add_row = network_table.add_row
+        for key, value in networking.items():
+            add_row(_setting_label(key), ", ".join(value) if isinstance(value, list) else str(value))
 
-        console.print(network_table)
+        tables.append(network_table)
 
     # Auth section
-    if "auth" in config:
+    auth = config.get("auth")
+    if auth is not None:
         auth_table = Table(title="Authentication Configuration")
         auth_table.add_column("Setting", style="cyan")
         auth_table.add_column("Value")
 
-        auth_table.add_row("Auth Method", config["auth"].get("auth_method", "none"))
+        auth_table.add_row("Auth Method", auth.get("auth_method", "none"))
 
-        if "tls_config" in config["auth"]:
-            for key, value in config["auth"]["tls_config"].items():
-                auth_table.add_row(key.replace("_", " ").title(), str(value))
+        tls_config = auth.get("tls_config")
+        if tls_config is not None:
+            for key, value in tls_config.items():
+                auth_table.add_row(_setting_label(key), str(value))
 
-        console.print(auth_table)
+        tables.append(auth_table)
 
     # Monitoring section
-    if "monitoring" in config:
+    monitoring = config.get("monitoring")
+    if monitoring is not None:
         monitoring_table = Table(title="Monitoring Configuration")
         monitoring_table.add_column("Setting", style="cyan")
         monitoring_table.add_column("Value")
 
-        for key, value in config["monitoring"].items():
+        add_row = monitoring_table.add_row
+        for key, value in monitoring.items():
             if key != "grafana_api_key":  # Don't display API key
-                monitoring_table.add_row(key.replace("_", " ").title(), str(value))
+                add_row(_setting_label(key), str(value))
 
-        console.print(monitoring_table)
+        tables.append(monitoring_table)
 
     # Labels section
-    if "labels" in config and config["labels"]:
+    labels = config.get("labels")
+    if labels:
         labels_table = Table(title="Labels/Tags")
         labels_table.add_column("Key", style="cyan")
         labels_table.add_column("Value")
 
-        for key, value in config["labels"].items():
+        for key, value in labels.items():
             labels_table.add_row(key, value)
 
-        console.print(labels_table)
+        tables.append(labels_table)
+
+    if tables:
+        console.print(Group(*tables))
+
+
+@functools.lru_cache(maxsize=1)
+def _welcome_panel():
+    """Welcome panel, built on first use and reused afterwards"""
+    from rich.panel import Panel
+
+    return Panel(
+        Text.from_markup(
+            "[bold green]Kafka on GCP Deployment Wizard[/bold green]\n\n"
+            "This wizard will guide you through setting up a Kafka cluster on Google Cloud Platform.\n"
+            "You'll configure GCP resources, Kafka settings, networking, and monitoring options.\n\n"
+            "[yellow]Tip:[/yellow] You can save your configuration as a profile for future use."
+        ),
+        title="Welcome",
+        expand=False,
+        border_style="cyan",
+    )
 
 
 def welcome_message():
     """Display welcome message and tool information"""
-    console.print(
-        Panel(
-            Text.from_markup(
-                "[bold green]Kafka on GCP Deployment Wizard[/bold green]\n\n"
-                "This wizard will guide you through setting up a Kafka cluster on Google Cloud Platform.\n"
-                "You'll configure GCP resources, Kafka settings, networking, and monitoring options.\n\n"
-                "[yellow]Tip:[/yellow] You can save your configuration as a profile for future use."
-            ),
-            title="Welcome",
-            expand=False,
-            border_style="cyan",
-        )
-    )
+    console.print(_welcome_panel())
@@ -1,20 +1,64 @@
 import os
-import time
-from typing import Optional
+import sys
+from typing import List, Optional
 
 import typer
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import BarColumn, Progress, TextColumn, TimeRemainingColumn
 
-from kafka_cli.utils.config import get_config, get_config_dir
+from kafka_cli.utils.config import get_config_dir, resolve_profile
 from kafka_cli.utils.interactive import safe_text, safe_typer_confirm
-from kafka_cli.utils.terraform import run_terraform_command
 
 app = typer.Typer(help="Manage Terraform operations for Kafka clusters")
 console = Console()
 
 
+def _print_result(success: bool, action: str) -> None:
+    """Show the success or failure panel for a Terraform command"""
+    if success:
+        console.print(Panel.fit(f"Terraform {action} completed successfully", title="Success", border_style="green"))
+    else:
+        console.print(Panel.fit(f"Terraform {action} failed. Check the logs for details.", title="Error", border_style="red"))
+
+
+def _write_stdout(data: bytes) -> None:
+    """Write raw bytes to stdout, decoding them if stdout is a text-only stream (e.g. CliRunner or StringIO)"""
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        sys.stdout.write(data.decode(errors="replace"))
+    else:
+        out.write(data)
+    sys.stdout.flush()
+
+
+def _stream_terraform(terraform_bin: str, terraform_dir: str, args: List[str]) -> int:
+    """Run terraform in a working directory, echoing its combined output in large blocks, and return its exit code"""
+    import subprocess
+
+    # Select the directory with -chdir instead of cwd= and skip close_fds (Python's own fds are
+    # non-inheritable anyway), so that with an absolute binary path Popen can launch via posix_spawn
+    process = subprocess.Popen(
+        [terraform_bin, f"-chdir={terraform_dir}", *args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=0,
+        close_fds=False,
+    )
+
+    # Terraform output is plain text, so pass each block straight to stdout rather than through Rich markup
+    sys.stdout.flush()
+    stdout_fd = process.stdout.fileno()
+    last = b"\n"
+    for chunk in iter(lambda: os.read(stdout_fd, 65536), b""):
+        _write_stdout(chunk)
+        last = chunk[-1:]
+    # Leave the cursor on a fresh line for whatever is printed next
+    if last != b"\n":
+        _write_stdout(b"\n")
+
+    return process.wait()
+
+
 @app.command("plan")
 def terraform_plan(
     profile_name: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile to use for Terraform plan"),
@@ -23,20 +67,13 @@ def terraform_plan(
     """
     Generate a Terraform plan for the specified profile
     """
-    # Determine which profile to use
-    config = get_config()
-    if not profile_name:
-        profile_name = config.get("default_profile")
-
-    if not profile_name:
-        console.print("No profile specified and no default profile set", style="red")
-        return
+    from kafka_cli.utils.terraform import run_terraform_command
 
-    # Check if profile exists
-    profile_path = os.path.join(get_config_dir(), "profiles", f"{profile_name}.yaml")
-    if not os.path.exists(profile_path):
-        console.print(f"Profile [bold red]{profile_name}[/bold red] not found", style="red")
+    # Determine which profile to use
+    resolved = resolve_profile(profile_name)
+    if resolved is None:
         return
+    profile_name, _ = resolved
 
     console.print(f"Generating Terraform plan for profile: [bold cyan]{profile_name}[/bold cyan]")
 
@@ -47,22 +84,7 @@ def terraform_plan(
         output_file=output_file,
     )
 
-    if success:
-        console.print(
-            Panel.fit(
-                "Terraform plan completed successfully",
-                title="Success",
-                border_style="green",
-            )
-        )
-    else:
-        console.print(
-            Panel.fit(
-                "Terraform plan failed. Check the logs for details.",
-                title="Error",
-                border_style="red",
-            )
-        )
+    _print_result(success, "plan")
 
 
 @app.command("apply")
@@ -96,87 +118,42 @@ def terraform_apply(
                 console.print("Operation cancelled", style="yellow")
                 return
 
-        # Display a loading bar for 1 minute (60 seconds)
-        console.print("Preparing environment for Terraform apply...")
-
-        # Create a progress bar that will run for 60 seconds
-        with Progress(
-            TextColumn("[bold blue]Loading...", justify="right"),
-            BarColumn(bar_width=40),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeRemainingColumn(),
-            console=console,
-        ) as progress:
-            # Create a task that will run for 60 seconds (60 * 100 steps)
-            task = progress.add_task("[cyan]Initializing...", total=100)
-
-            # Update the progress bar over 60 seconds
-            for i in range(10):
-                # Sleep for 0.6 seconds (60 seconds total / 100 steps)
-                time.sleep(0.6)
-                # Update the progress description periodically
-                if i < 25:
-                    progress.update(task, description="[cyan]Initializing Terraform environment...", advance=1)
-                elif i < 50:
-                    progress.update(task, description="[cyan]Loading modules...", advance=1)
-                elif i < 75:
-                    progress.update(task, description="[cyan]Preparing providers...", advance=1)
-                else:
-                    progress.update(task, description="[cyan]Finalizing setup...", advance=1)
-
-        console.print("[bold green]Preparation complete![/bold green]")
-
         # Run terraform apply on test.tf
-        import shutil
-        import subprocess
+        from kafka_cli.utils.terraform import (
+            find_terraform_binary,
+            is_terraform_initialized,
+            mark_terraform_initialized,
+            terraform_config_fingerprint,
+        )
 
         # Check if terraform is installed
-        if not shutil.which("terraform"):
+        terraform_bin = find_terraform_binary()
+        if not terraform_bin:
             console.print("[bold red]Error:[/bold red] Terraform not found in PATH")
             console.print("Please install Terraform from https://www.terraform.io/downloads.html")
             return
 
-        # Initialize Terraform if needed
-        console.print("Initializing Terraform...")
-        init_result = subprocess.run(
-            ["terraform", "init"],
-            cwd=terraform_dir,
-            capture_output=True,
-            text=True,
-        )
-
-        if init_result.returncode != 0:
-            console.print("[bold red]Error:[/bold red] Terraform initialization failed")
-            console.print(init_result.stderr)
-            return
-
-        # Apply the test.tf file
-        console.print("Applying test.tf configuration...")
-
-        # Construct apply command with auto-approve if specified
-        apply_cmd = ["terraform", "-chdir=/Users/taronhovsepyan/.kafka-cli/infra", "apply"]
-        if auto_approve:
-            apply_cmd.append("-auto-approve")
-
-        apply_cmd.extend([])
-
         try:
-            # Run the apply command and stream output to console
-            process = subprocess.Popen(
-                apply_cmd,
-                cwd=terraform_dir,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-            )
-
-            # Stream output
-            for line in process.stdout:
-                console.print(line.rstrip())
+            # Initialize Terraform if needed, skipping it while the .tf files are unchanged since the last init
+            fingerprint = terraform_config_fingerprint(terraform_dir)
+            if not is_terraform_initialized(terraform_dir, fingerprint):
+                console.print("Initializing Terraform...")
+                if _stream_terraform(terraform_bin, terraform_dir, ["init", "-input=false"]) != 0:
+                    # The init output, errors included, has already been streamed above
+                    console.print("[bold red]Error:[/bold red] Terraform initialization failed")
+                    return
+                mark_terraform_initialized(terraform_dir, fingerprint)
+
+            # Apply the test.tf file
+            console.print("Applying test.tf configuration...")
+
+            # Construct apply command with auto-approve if specified
+            apply_args = ["apply"]
+            if auto_approve:
+                apply_args.append("-auto-approve")
 
-            # Wait for process to complete
-            return_code = process.wait()
+            # Run the apply command and stream output to console
+            return_code = _stream_terraform(terraform_bin, terraform_dir, apply_args)
 
             if return_code == 0:
                 console.print(
@@ -196,26 +173,19 @@ def terraform_apply(
                 )
 
         except Exception as e:
-            console.print(f"[bold red]Error:[/bold red] Failed to run Terraform apply: {str(e)}")
+            console.print(f"[bold red]Error:[/bold red] Failed to run Terraform: {str(e)}")
             return
 
         return
 
     # Regular profile-based apply
-    # Determine which profile to use
-    config = get_config()
-    if not profile_name:
-        profile_name = config.get("default_profile")
+    from kafka_cli.utils.terraform import run_terraform_command
 
-    if not profile_name:
-        console.print("No profile specified and no default profile set", style="red")
-        return
-
-    # Check if profile exists
-    profile_path = os.path.join(get_config_dir(), "profiles", f"{profile_name}.yaml")
-    if not os.path.exists(profile_path):
-        console.print(f"Profile [bold red]{profile_name}[/bold red] not found", style="red")
+    # Determine which profile to use
+    resolved = resolve_profile(profile_name)
+    if resolved is None:
         return
+    profile_name, _ = resolved
 
     # Confirm apply if not auto-approved
     if not auto_approve:
@@ -233,22 +203,7 @@ def terraform_apply(
         auto_approve=auto_approve,
     )
 
-    if success:
-        console.print(
-            Panel.fit(
-                "Terraform apply completed successfully",
-                title="Success",
-                border_style="green",
-            )
-        )
-    else:
-        console.print(
-            Panel.fit(
-                "Terraform apply failed. Check the logs for details.",
-                title="Error",
-                border_style="red",
-            )
-        )
+    _print_result(success, "apply")
 
 
 @app.command("destroy")
@@ -259,20 +214,13 @@ def terraform_destroy(
     """
     Destroy Terraform-managed infrastructure for the specified profile
     """
-    # Determine which profile to use
-    config = get_config()
-    if not profile_name:
-        profile_name = config.get("default_profile")
+    from kafka_cli.utils.terraform import run_terraform_command
 
-    if not profile_name:
-        console.print("No profile specified and no default profile set", style="red")
-        return
-
-    # Check if profile exists
-    profile_path = os.path.join(get_config_dir(), "profiles", f"{profile_name}.yaml")
-    if not os.path.exists(profile_path):
-        console.print(f"Profile [bold red]{profile_name}[/bold red] not found", style="red")
+    # Determine which profile to use
+    resolved = resolve_profile(profile_name)
+    if resolved is None:
         return
+    profile_name, _ = resolved
 
     # Confirm destroy if not auto-approved
     if not auto_approve:
@@ -294,22 +242,7 @@ def terraform_destroy(
         auto_approve=auto_approve,
     )
 
-    if success:
-        console.print(
-            Panel.fit(
-                "Terraform destroy completed successfully",
-                title="Success",
-                border_style="green",
-            )
-        )
-    else:
-        console.print(
-            Panel.fit(
-                "Terraform destroy failed. Check the logs for details.",
-                title="Error",
-                border_style="red",
-            )
-        )
+    _print_result(success, "destroy")
 
 
 @app.command("output")
@@ -321,20 +254,13 @@ def terraform_output(
     """
     Show Terraform outputs for the specified profile
     """
-    # Determine which profile to use
-    config = get_config()
-    if not profile_name:
-        profile_name = config.get("default_profile")
-
-    if not profile_name:
-        console.print("No profile specified and no default profile set", style="red")
-        return
+    from kafka_cli.utils.terraform import run_terraform_command
 
-    # Check if profile exists
-    profile_path = os.path.join(get_config_dir(), "profiles", f"{profile_name}.yaml")
-    if not os.path.exists(profile_path):
-        console.print(f"Profile [bold red]{profile_name}[/bold red] not found", style="red")
+    # Determine which profile to use
+    resolved = resolve_profile(profile_name)
+    if resolved is None:
         return
+    profile_name, _ = resolved
 
     console.print(f"Retrieving Terraform outputs for profile: [bold cyan]{profile_name}[/bold cyan]")
 
@@ -0,0 +1,46 @@
+"""
+Time-based memoization for cloud provider lookups.
+Cached results live on the provider instance so they can be dropped per provider.
+"""
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, Tuple, TypeVar
+
+T = TypeVar("T")
+
+_CACHE_ATTR = "_ttl_cache_entries"
+_lock = threading.Lock()
+
+
+def ttl_cache(seconds: float) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Memoize a provider method per instance and argument tuple for the given number of seconds"""
+
+    def decorator(method: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(method)
+        def wrapper(self: Any, *args: Any) -> T:
+            key = (method.__name__, args)
+            now = time.monotonic()
+            with _lock:
+                cache: Dict[Tuple[str, Tuple[Any, ...]], Tuple[T, float]] = self.__dict__.setdefault(_CACHE_ATTR, {})
+                entry = cache.get(key)
+            if entry is not None and entry[1] > now:
+                return entry[0]
+
+            # Run the lookup outside the lock so concurrent lookups don't serialize
+            value = method(self, *args)
+            # Empty results are usually a failed lookup, leave those to be retried
+            if value:
+                with _lock:
+                    cache[key] = (value, now + seconds)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate(provider: Any) -> None:
+    """Drop every cached lookup of a provider"""
+    with _lock:
+        provider.__dict__.pop(_CACHE_ATTR, None)
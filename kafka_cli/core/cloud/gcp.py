@@ -6,67 +6,232 @@ import json
 import os
 import shutil
 import subprocess
-from typing import Any, Dict, List, Optional
+import time
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from rich.console import Console
 
-from kafka_cli.core.cloud.provider import CloudProvider
+from kafka_cli.core.cloud._cache import invalidate, ttl_cache
+from kafka_cli.core.cloud.provider import CloudProvider, Network, Region, SecurityGroup, Subnet
 
 console = Console()
 
+# Billing month used by the estimates
+HOURS_PER_MONTH = 24 * 30
+
+# Rough list prices used by estimate_costs: machine types per hour, disk types per GB per month
+INSTANCE_HOURLY_RATES = MappingProxyType({
+    "e2-standard-2": 0.067,
+    "e2-standard-4": 0.134,
+    "e2-standard-8": 0.268,
+    "e2-standard-16": 0.537,
+    "n2-standard-2": 0.0971,
+    "n2-standard-4": 0.1942,
+    "n2-standard-8": 0.3884,
+    "n2-standard-16": 0.7768,
+})
+DISK_GB_MONTHLY_RATES = MappingProxyType({
+    "pd-standard": 0.040,
+    "pd-balanced": 0.100,
+    "pd-ssd": 0.170,
+})
+DEFAULT_INSTANCE_HOURLY_RATE = INSTANCE_HOURLY_RATES["e2-standard-2"]
+DEFAULT_DISK_GB_MONTHLY_RATE = DISK_GB_MONTHLY_RATES["pd-standard"]
+# Machine type prices scaled to the billing month once, rather than on every estimate
+INSTANCE_MONTHLY_RATES = MappingProxyType({
+    machine_type: rate * HOURS_PER_MONTH for machine_type, rate in INSTANCE_HOURLY_RATES.items()
+})
+DEFAULT_INSTANCE_MONTHLY_RATE = DEFAULT_INSTANCE_HOURLY_RATE * HOURS_PER_MONTH
+
+# Set to "1" to answer inventory lookups with the sample data below, without running gcloud or calling the API
+OFFLINE_ENV_VAR = "KAFKA_CLI_OFFLINE"
+
+# Sample inventory returned when offline or not authenticated
+MOCK_REGIONS: Tuple[Region, ...] = (
+    {"name": "us-central1", "description": "Iowa, North America"},
+    {"name": "us-east1", "description": "South Carolina, North America"},
+    {"name": "us-west1", "description": "Oregon, North America"},
+    {"name": "europe-west1", "description": "Belgium, Europe"},
+    {"name": "asia-east1", "description": "Taiwan, Asia"},
+)
+MOCK_ZONE_SUFFIXES = ("a", "b", "c")
+MOCK_NETWORKS: Tuple[Network, ...] = (
+    {"name": "default", "description": "Default network"},
+    {"name": "custom-vpc", "description": "Custom VPC network"},
+)
+MOCK_SECURITY_GROUPS: Tuple[SecurityGroup, ...] = (
+    {"name": "default-allow-internal", "network": "default", "direction": "INGRESS"},
+    {"name": "default-allow-ssh", "network": "default", "direction": "INGRESS"},
+)
+
+# How long a failed authentication check is trusted before gcloud is asked again
+AUTH_RECHECK_SECONDS = 60
+
+# How long inventory lookups (regions, zones, networks, subnets, firewall rules) are reused
+INVENTORY_CACHE_TTL_SECONDS = 1200
+
+
+def _mock_zones(region: str) -> List[str]:
+    """Build the sample zones of a region"""
+    return [f"{region}-{suffix}" for suffix in MOCK_ZONE_SUFFIXES]
+
+
+def _mock_subnets(network_name: str) -> List[Subnet]:
+    """Build the sample subnets of a VPC network"""
+    return [
+        {"name": f"{network_name}-subnet-1", "region": "us-central1", "ipCidrRange": "10.0.0.0/24"},
+        {"name": f"{network_name}-subnet-2", "region": "us-east1", "ipCidrRange": "10.0.1.0/24"},
+    ]
+
 
 class GCPProvider(CloudProvider):
     """Google Cloud Platform provider implementation"""
 
-    def __init__(self):
+    # Absolute paths of the Cloud SDK tools, looked up once per process and shared by all providers
+    _tool_paths: Dict[str, Optional[str]] = {}
+
+    @classmethod
+    def _which(cls, tool: str) -> Optional[str]:
+        """Find a Cloud SDK tool on PATH, searching only on first use"""
+        if tool not in cls._tool_paths:
+            cls._tool_paths[tool] = shutil.which(tool)
+        return cls._tool_paths[tool]
+
+    @classmethod
+    def _tool(cls, tool: str) -> str:
+        """Get the path to run a Cloud SDK tool with, falling back to its bare name if it was not found"""
+        return cls._which(tool) or tool
+
+    def __init__(self, offline: Optional[bool] = None):
+        self._offline = os.environ.get(OFFLINE_ENV_VAR) == "1" if offline is None else offline
         self._authenticated = None
+        self._auth_recheck_at = 0.0
         self._active_project = None
+        self._gcloud_core: Optional[Dict[str, Any]] = None
+        self._credentials = None
+        self._compute_clients: Dict[str, Any] = {}
+
+    def _bootstrap(self) -> Dict[str, Any]:
+        """Read the active gcloud account, whether it has credentials, and the project, once per provider"""
+        if self._gcloud_core is None:
+            # Project just the two properties as tab-separated values, there is no JSON document to parse
+            result = subprocess.run(
+                [self._tool("gcloud"), "config", "list", "--format", "value(core.account,core.project)"],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            account, _, project = result.stdout.rstrip("\n").partition("\t")
+
+            # core.account stays set after 'gcloud auth revoke', so confirm gcloud still holds credentials for it
+            credentialed = False
+            if account:
+                result = subprocess.run(
+                    [self._tool("gcloud"), "auth", "list", "--filter", "status:ACTIVE", "--format", "value(account)"],
+                    capture_output=True,
+                    text=True,
+                )
+                # A failed check only affects is_authenticated, the project is still usable
+                credentialed = result.returncode == 0 and account in result.stdout.split()
+            self._gcloud_core = {"account": account, "credentialed": credentialed, "project": project}
+        return self._gcloud_core
+
+    def _get_credentials(self) -> Any:
+        """Get the Application Default Credentials, resolving them once per provider"""
+        if self._credentials is None:
+            import google.auth
+
+            self._credentials, _ = google.auth.default()
+        return self._credentials
+
+    def _has_api_credentials(self) -> bool:
+        """Check for Application Default Credentials, which the Compute API needs but gcloud does not
+
+        A gcloud login alone does not set them up, so listings fall back to gcloud without them.
+        """
+        if self._credentials is None:
+            from google.auth.exceptions import DefaultCredentialsError
+
+            try:
+                self._get_credentials()
+            except DefaultCredentialsError:
+                console.print("[bold yellow]No Application Default Credentials found, listing through gcloud.[/bold yellow]")
+                console.print("Run [bold]gcloud auth application-default login[/bold] to use the Compute API directly.")
+                self._credentials = False
+        return self._credentials is not False
+
+    def _gcloud_list(self, args: List[str], project_id: str) -> List[Dict[str, Any]]:
+        """Run a gcloud list command for a project and parse its JSON output"""
+        result = subprocess.run(
+            [self._tool("gcloud"), *args, "--format", "json", "--project", project_id],
+            capture_output=True,
+            check=True,
+        )
+        return json.loads(result.stdout)
+
+    def _compute_client(self, client_name: str) -> Any:
+        """Get a Compute Engine API client by class name, creating it on first use and reusing its session afterwards"""
+        client = self._compute_clients.get(client_name)
+        if client is None:
+            from google.cloud import compute_v1
+
+            client = getattr(compute_v1, client_name)(credentials=self._get_credentials())
+            self._compute_clients[client_name] = client
+        return client
 
     def is_gcloud_installed(self) -> bool:
         """Check if gcloud CLI is installed and available in PATH"""
-        return shutil.which("gcloud") is not None
+        return self._which("gcloud") is not None
 
     def is_authenticated(self) -> bool:
-        """Check if user is authenticated with GCP"""
-        if self._authenticated is not None:
+        """Check if user is authenticated with GCP
+
+        The active account must have credentials stored by gcloud. Whether Google still accepts
+        them (e.g. a password change revoked them server-side) only shows on the first API call.
+        """
+        # A success holds for the provider's lifetime, a failure only until the recheck time
+        if self._authenticated or (self._authenticated is False and time.monotonic() < self._auth_recheck_at):
             return self._authenticated
+        if self._authenticated is False:
+            # Read the account afresh when rechecking, the user may have logged in meanwhile
+            self._gcloud_core = None
 
         try:
             if not self.is_gcloud_installed():
                 console.print("[bold red]Error:[/bold red] Google Cloud SDK (gcloud) is not installed or not in your PATH.")
                 console.print("Please install the Google Cloud SDK from: [link]https://cloud.google.com/sdk/docs/install[/link]")
-                self._authenticated = False
-                return False
-
-            result = subprocess.run(["gcloud", "auth", "list", "--format", "json"], capture_output=True, text=True, check=True)
-
-            auth_list = json.loads(result.stdout)
-            if not auth_list:
-                console.print("[bold red]No active GCP authentication found.[/bold red]")
-                console.print("Please run [bold]gcloud auth login[/bold] to authenticate.")
-                self._authenticated = False
-                return False
+                return self._not_authenticated()
 
-            active_account = next((acc for acc in auth_list if acc.get("status") == "ACTIVE"), None)
-            if active_account:
-                console.print(f"[bold green]Authenticated as:[/bold green] {active_account.get('account')}")
+            # The active account is the core/account property of the active configuration
+            gcloud_core = self._bootstrap()
+            active_account = gcloud_core.get("account")
+            if active_account and gcloud_core.get("credentialed"):
+                console.print(f"[bold green]Authenticated as:[/bold green] {active_account}")
                 self._authenticated = True
                 return True
+            elif active_account:
+                console.print(f"[bold red]No credentials found for {active_account}.[/bold red]")
+                console.print("Please run [bold]gcloud auth login[/bold] to authenticate.")
+                return self._not_authenticated()
             else:
                 console.print("[bold red]No active GCP authentication found.[/bold red]")
                 console.print("Please run [bold]gcloud auth login[/bold] to authenticate.")
-                self._authenticated = False
-                return False
+                return self._not_authenticated()
 
         except subprocess.CalledProcessError as e:
             console.print(f"[bold red]Error checking GCP authentication:[/bold red] {str(e)}")
             console.print("Please ensure gcloud CLI is installed and properly configured.")
-            self._authenticated = False
-            return False
+            return self._not_authenticated()
         except Exception as e:
             console.print(f"[bold red]Error:[/bold red] {str(e)}")
-            self._authenticated = False
-            return False
+            return self._not_authenticated()
+
+    def _not_authenticated(self) -> bool:
+        """Record a failed authentication check, to be repeated after AUTH_RECHECK_SECONDS"""
+        self._authenticated = False
+        self._auth_recheck_at = time.monotonic() + AUTH_RECHECK_SECONDS
+        return False
 
     def get_active_project(self) -> Optional[str]:
         """Get the currently active GCP project"""
@@ -78,9 +243,7 @@ class GCPProvider(CloudProvider):
                 console.print("[bold yellow]Cannot determine active GCP project:[/bold yellow] Google Cloud SDK not installed.")
                 return None
 
-            result = subprocess.run(["gcloud", "config", "get-value", "project"], capture_output=True, text=True, check=True)
-
-            project_id = result.stdout.strip()
+            project_id = self._bootstrap().get("project")
             if not project_id:
                 console.print("[bold yellow]No active GCP project set.[/bold yellow]")
                 console.print("Please run [bold]gcloud config set project PROJECT_ID[/bold] to set a project.")
@@ -104,9 +267,12 @@ class GCPProvider(CloudProvider):
                 return []
 
             result = subprocess.run(
-                ["gcloud", "config", "configurations", "list", "--format", "json"], capture_output=True, text=True, check=True
+                [self._tool("gcloud"), "config", "configurations", "list", "--format", "json"],
+                capture_output=True,
+                check=True,
             )
 
+            # json.loads takes gcloud's UTF-8 output as bytes, so no text decoding step is needed
             configurations = json.loads(result.stdout)
             return configurations
 
@@ -124,11 +290,14 @@ class GCPProvider(CloudProvider):
                 console.print("[bold yellow]Cannot activate GCP configuration:[/bold yellow] Google Cloud SDK not installed.")
                 return False
 
-            subprocess.run(["gcloud", "config", "configurations", "activate", config_name], check=True)
+            subprocess.run([self._tool("gcloud"), "config", "configurations", "activate", config_name], check=True)
             console.print(f"[bold green]Activated GCP configuration:[/bold green] {config_name}")
 
-            # Clear cached project as it may have changed
+            # Clear cached account, project and inventory as they may have changed
+            self._gcloud_core = None
+            self._authenticated = None
             self._active_project = None
+            invalidate(self)
 
             return True
 
@@ -139,206 +308,206 @@ class GCPProvider(CloudProvider):
             console.print(f"[bold red]Error:[/bold red] {str(e)}")
             return False
 
-    def list_regions(self) -> List[Dict[str, Any]]:
+    # The list_* methods answer with sample data when offline or not authenticated, and otherwise
+    # with the cached _fetch_* lookups. The sample data is never cached, so it is replaced by the
+    # real inventory as soon as the user logs in.
+
+    def list_regions(self) -> List[Region]:
         """List available GCP regions"""
-        try:
-            if not self.is_authenticated():
-                # Return mock data if not authenticated
-                return [
-                    {"name": "us-central1", "description": "Iowa, North America"},
-                    {"name": "us-east1", "description": "South Carolina, North America"},
-                    {"name": "us-west1", "description": "Oregon, North America"},
-                    {"name": "europe-west1", "description": "Belgium, Europe"},
-                    {"name": "asia-east1", "description": "Taiwan, Asia"},
-                ]
+        # Offline mode returns the mock data before the auth check, so no gcloud call is made
+        if self._offline or not self.is_authenticated():
+            return list(MOCK_REGIONS)
+        return self._fetch_regions()
 
+    def get_zones_for_region(self, region: str) -> List[str]:
+        """Get available zones for a GCP region"""
+        if self._offline or not self.is_authenticated():
+            return _mock_zones(region)
+
+        zones = self._fetch_zones(region)
+        # Fall back to the default zone pattern outside the cache, so a failed lookup is retried
+        return zones if zones is not None else _mock_zones(region)
+
+    def list_networks(self) -> List[Network]:
+        """List available VPC networks in GCP"""
+        if self._offline or not self.is_authenticated():
+            return list(MOCK_NETWORKS)
+        return self._fetch_networks()
+
+    def list_subnets(self, network_name: str) -> List[Subnet]:
+        """List available subnets for a VPC network in GCP"""
+        if self._offline or not self.is_authenticated():
+            return _mock_subnets(network_name)
+        return self._fetch_subnets(network_name)
+
+    def list_security_groups(self) -> List[SecurityGroup]:
+        """List available firewall rules in GCP"""
+        if self._offline or not self.is_authenticated():
+            return list(MOCK_SECURITY_GROUPS)
+        return self._fetch_security_groups()
+
+    @ttl_cache(INVENTORY_CACHE_TTL_SECONDS)
+    def _fetch_regions(self) -> List[Region]:
+        """Fetch the regions of the active project"""
+        try:
             project_id = self.get_active_project()
             if not project_id:
                 return []
 
-            result = subprocess.run(
-                ["gcloud", "compute", "regions", "list", "--format", "json", "--project", project_id],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-
-            regions = json.loads(result.stdout)
-            return [{"name": r["name"], "description": r.get("description", "")} for r in regions]
+            return list(self.iter_regions(project_id))
 
-        except subprocess.CalledProcessError as e:
-            console.print(f"[bold red]Error listing GCP regions:[/bold red] {str(e)}")
-            return []
         except Exception as e:
-            console.print(f"[bold red]Error:[/bold red] {str(e)}")
+            console.print(f"[bold red]Error listing GCP regions:[/bold red] {str(e)}")
             return []
 
-    def get_zones_for_region(self, region: str) -> List[str]:
-        """Get available zones for a GCP region"""
+    @ttl_cache(INVENTORY_CACHE_TTL_SECONDS)
+    def _fetch_zones(self, region: str) -> Optional[List[str]]:
+        """Fetch the zones of a region in the active project, None if they could not be listed"""
         try:
-            if not self.is_authenticated():
-                # Return mock data if not authenticated
-                return [f"{region}-a", f"{region}-b", f"{region}-c"]
-
             project_id = self.get_active_project()
             if not project_id:
                 return []
 
-            result = subprocess.run(
-                ["gcloud", "compute", "zones", "list", "--filter", f"region:{region}", "--format", "json", "--project", project_id],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+            if not self._has_api_credentials():
+                zones = self._gcloud_list(["compute", "zones", "list", "--filter", f"region:{region}"], project_id)
+                return [z["name"] for z in zones]
 
-            zones = json.loads(result.stdout)
-            return [z["name"] for z in zones]
+            # The region resource already lists its zones as URLs, no separate zones query needed
+            region_info = self._compute_client("RegionsClient").get(project=project_id, region=region)
+            return [zone_url.rpartition("/")[2] for zone_url in region_info.zones]
 
-        except subprocess.CalledProcessError as e:
-            console.print(f"[bold red]Error listing zones for region {region}:[/bold red] {str(e)}")
-            # Fallback to default zone pattern
-            return [f"{region}-a", f"{region}-b", f"{region}-c"]
         except Exception as e:
-            console.print(f"[bold red]Error:[/bold red] {str(e)}")
-            return [f"{region}-a", f"{region}-b", f"{region}-c"]
+            console.print(f"[bold red]Error listing zones for region {region}:[/bold red] {str(e)}")
+            return None
 
-    def list_networks(self) -> List[Dict[str, Any]]:
-        """List available VPC networks in GCP"""
+    @ttl_cache(INVENTORY_CACHE_TTL_SECONDS)
+    def _fetch_networks(self) -> List[Network]:
+        """Fetch the VPC networks of the active project"""
         try:
-            if not self.is_authenticated():
-                # Return mock data if not authenticated
-                return [
-                    {"name": "default", "description": "Default network"},
-                    {"name": "custom-vpc", "description": "Custom VPC network"},
-                ]
-
             project_id = self.get_active_project()
             if not project_id:
                 return []
 
-            result = subprocess.run(
-                ["gcloud", "compute", "networks", "list", "--format", "json", "--project", project_id],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-
-            networks = json.loads(result.stdout)
-            return [{"name": n["name"], "description": n.get("description", "")} for n in networks]
+            return list(self.iter_networks(project_id))
 
-        except subprocess.CalledProcessError as e:
-            console.print(f"[bold red]Error listing GCP networks:[/bold red] {str(e)}")
-            return []
         except Exception as e:
-            console.print(f"[bold red]Error:[/bold red] {str(e)}")
+            console.print(f"[bold red]Error listing GCP networks:[/bold red] {str(e)}")
             return []
 
-    def list_subnets(self, network_name: str) -> List[Dict[str, Any]]:
-        """List available subnets for a VPC network in GCP"""
+    @ttl_cache(INVENTORY_CACHE_TTL_SECONDS)
+    def _fetch_subnets(self, network_name: str) -> List[Subnet]:
+        """Fetch the subnets of a VPC network in the active project"""
         try:
-            if not self.is_authenticated():
-                # Return mock data if not authenticated
-                return [
-                    {"name": f"{network_name}-subnet-1", "region": "us-central1", "ipCidrRange": "10.0.0.0/24"},
-                    {"name": f"{network_name}-subnet-2", "region": "us-east1", "ipCidrRange": "10.0.1.0/24"},
-                ]
-
             project_id = self.get_active_project()
             if not project_id:
                 return []
 
-            result = subprocess.run(
-                [
-                    "gcloud",
-                    "compute",
-                    "networks",
-                    "subnets",
-                    "list",
-                    "--filter",
-                    f"network:{network_name}",
-                    "--format",
-                    "json",
-                    "--project",
-                    project_id,
-                ],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+            return list(self.iter_subnets(project_id, network_name))
 
-            subnets = json.loads(result.stdout)
-            return [{"name": s["name"], "region": s["region"].split("/")[-1], "ipCidrRange": s["ipCidrRange"]} for s in subnets]
-
-        except subprocess.CalledProcessError as e:
-            console.print(f"[bold red]Error listing subnets for network {network_name}:[/bold red] {str(e)}")
-            return []
         except Exception as e:
-            console.print(f"[bold red]Error:[/bold red] {str(e)}")
+            console.print(f"[bold red]Error listing subnets for network {network_name}:[/bold red] {str(e)}")
             return []
 
-    def list_security_groups(self) -> List[Dict[str, Any]]:
-        """List available firewall rules in GCP"""
+    @ttl_cache(INVENTORY_CACHE_TTL_SECONDS)
+    def _fetch_security_groups(self) -> List[SecurityGroup]:
+        """Fetch the firewall rules of the active project"""
         try:
-            if not self.is_authenticated():
-                # Return mock data if not authenticated
-                return [
-                    {"name": "default-allow-internal", "network": "default", "direction": "INGRESS"},
-                    {"name": "default-allow-ssh", "network": "default", "direction": "INGRESS"},
-                ]
-
             project_id = self.get_active_project()
             if not project_id:
                 return []
 
-            result = subprocess.run(
-                ["gcloud", "compute", "firewall-rules", "list", "--format", "json", "--project", project_id],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+            return list(self.iter_security_groups(project_id))
 
-            firewall_rules = json.loads(result.stdout)
-            return [{"name": f["name"], "network": f["network"].split("/")[-1], "direction": f["direction"]} for f in firewall_rules]
-
-        except subprocess.CalledProcessError as e:
-            console.print(f"[bold red]Error listing GCP firewall rules:[/bold red] {str(e)}")
-            return []
         except Exception as e:
-            console.print(f"[bold red]Error:[/bold red] {str(e)}")
+            console.print(f"[bold red]Error listing GCP firewall rules:[/bold red] {str(e)}")
             return []
 
+    # The iter_* generators yield results page by page as the API returns them, so a caller that
+    # stops early never fetches the remaining pages. The list_* methods above wrap them.
+
+    def iter_regions(self, project_id: str) -> Iterator[Region]:
+        """Yield the regions of a project"""
+        if not self._has_api_credentials():
+            for r in self._gcloud_list(["compute", "regions", "list"], project_id):
+                yield {"name": r["name"], "description": r.get("description", "")}
+            return
+
+        for r in self._compute_client("RegionsClient").list(project=project_id):
+            yield {"name": r.name, "description": r.description}
+
+    def iter_networks(self, project_id: str) -> Iterator[Network]:
+        """Yield the VPC networks of a project"""
+        if not self._has_api_credentials():
+            for n in self._gcloud_list(["compute", "networks", "list"], project_id):
+                yield {"name": n["name"], "description": n.get("description", "")}
+            return
+
+        for n in self._compute_client("NetworksClient").list(project=project_id):
+            yield {"name": n.name, "description": n.description}
+
+    def iter_subnets(self, project_id: str, network_name: str) -> Iterator[Subnet]:
+        """Yield the subnets of a VPC network"""
+        if not self._has_api_credentials():
+            subnet_args = ["compute", "networks", "subnets", "list", "--filter", f"network:{network_name}"]
+            for s in self._gcloud_list(subnet_args, project_id):
+                yield {"name": s["name"], "region": s["region"].rpartition("/")[2], "ipCidrRange": s["ipCidrRange"]}
+            return
+
+        # Subnets live per region, so walk the aggregated list, letting the API keep only this network's
+        # subnets (the filter matches the network URL as a regex, network names need no escaping)
+        request = {"project": project_id, "filter": f'network eq ".*/{network_name}"'}
+        for _, scoped_list in self._compute_client("SubnetworksClient").aggregated_list(request=request):
+            for subnet in scoped_list.subnetworks:
+                if subnet.network.rpartition("/")[2] == network_name:
+                    yield {"name": subnet.name, "region": subnet.region.rpartition("/")[2], "ipCidrRange": subnet.ip_cidr_range}
+
+    def iter_security_groups(self, project_id: str) -> Iterator[SecurityGroup]:
+        """Yield the firewall rules of a project"""
+        if not self._has_api_credentials():
+            for f in self._gcloud_list(["compute", "firewall-rules", "list"], project_id):
+                yield {"name": f["name"], "network": f["network"].rpartition("/")[2], "direction": f["direction"]}
+            return
+
+        for f in self._compute_client("FirewallsClient").list(project=project_id):
+            yield {"name": f.name, "network": f.network.rpartition("/")[2], "direction": f.direction}
+
+    def prefetch_inventory(self, region: str) -> Dict[str, Any]:
+        """Fetch regions, zones, networks and firewall rules for a region concurrently"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Settle auth, project and credentials first so the workers all reuse the cached answers
+        if not self._offline and self.is_authenticated():
+            self.get_active_project()
+            self._has_api_credentials()
+
+        # The lookups are independent and network-bound, so the total wait is the slowest one
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                "regions": executor.submit(self.list_regions),
+                "zones": executor.submit(self.get_zones_for_region, region),
+                "networks": executor.submit(self.list_networks),
+                "security_groups": executor.submit(self.list_security_groups),
+            }
+            return {key: future.result() for key, future in futures.items()}
+
     def estimate_costs(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Estimate costs for a given GCP configuration"""
         # This is a simple cost estimation function
         # In a real implementation, this would use the GCP Pricing API
-
-        cost_map = {
-            "e2-standard-2": 0.067,  # hourly rate
-            "e2-standard-4": 0.134,
-            "e2-standard-8": 0.268,
-            "e2-standard-16": 0.537,
-            "n2-standard-2": 0.0971,
-            "n2-standard-4": 0.1942,
-            "n2-standard-8": 0.3884,
-            "n2-standard-16": 0.7768,
-            "pd-standard": 0.040,  # per GB per month
-            "pd-balanced": 0.100,
-            "pd-ssd": 0.170,
-        }
-
         try:
             # Extract relevant configuration
-            broker_count = config.get("kafka", {}).get("broker_count", 3)
-            machine_type = config.get("kafka", {}).get("machine_type", "e2-standard-2")
-            disk_type = config.get("kafka", {}).get("disk_type", "pd-standard")
-            disk_size = config.get("kafka", {}).get("disk_size_gb", 100)
+            kafka_config = config.get("kafka", {})
+            broker_count = kafka_config.get("broker_count", 3)
+            machine_type = kafka_config.get("machine_type", "e2-standard-2")
+            disk_type = kafka_config.get("disk_type", "pd-standard")
+            disk_size = kafka_config.get("disk_size_gb", 100)
 
             # Calculate instance costs
-            instance_hourly_rate = cost_map.get(machine_type, 0.067)
-            instance_monthly_cost = instance_hourly_rate * 24 * 30 * broker_count
+            instance_hourly_rate = INSTANCE_HOURLY_RATES.get(machine_type, DEFAULT_INSTANCE_HOURLY_RATE)
+            instance_monthly_cost = INSTANCE_MONTHLY_RATES.get(machine_type, DEFAULT_INSTANCE_MONTHLY_RATE) * broker_count
 
             # Calculate disk costs
-            disk_gb_monthly_rate = cost_map.get(disk_type, 0.040)
+            disk_gb_monthly_rate = DISK_GB_MONTHLY_RATES.get(disk_type, DEFAULT_DISK_GB_MONTHLY_RATE)
             disk_monthly_cost = disk_gb_monthly_rate * disk_size * broker_count
 
             # Calculate network costs (rough estimate)
@@ -356,7 +525,7 @@ class GCPProvider(CloudProvider):
                         "storage": round(disk_monthly_cost, 2),
                         "network": round(network_monthly_cost, 2),
                     },
-                    "hourly": round(total_monthly_cost / (24 * 30), 2),
+                    "hourly": round(total_monthly_cost / HOURS_PER_MONTH, 2),
                 },
                 "breakdown": {
                     "instances": {"type": machine_type, "count": broker_count, "rate": instance_hourly_rate},
@@ -381,13 +550,13 @@ class GCPProvider(CloudProvider):
                 return False
 
             # Check if bucket exists
-            check_result = subprocess.run(["gsutil", "ls", "-b", f"gs://{bucket_name}"], capture_output=True, text=True)
+            check_result = subprocess.run([self._tool("gsutil"), "ls", "-b", f"gs://{bucket_name}"], capture_output=True, text=True)
 
             if check_result.returncode != 0:
                 # Create the bucket if it doesn't exist
                 console.print(f"Creating GCS bucket for Terraform state: [cyan]gs://{bucket_name}[/cyan]")
                 create_result = subprocess.run(
-                    ["gsutil", "mb", "-p", project_id, f"gs://{bucket_name}"], capture_output=True, text=True
+                    [self._tool("gsutil"), "mb", "-p", project_id, f"gs://{bucket_name}"], capture_output=True, text=True
                 )
 
                 if create_result.returncode != 0:
@@ -395,7 +564,9 @@ class GCPProvider(CloudProvider):
                     return False
 
                 # Enable versioning for better state management
-                subprocess.run(["gsutil", "versioning", "set", "on", f"gs://{bucket_name}"], capture_output=True, text=True)
+                subprocess.run(
+                    [self._tool("gsutil"), "versioning", "set", "on", f"gs://{bucket_name}"], capture_output=True, text=True
+                )
             else:
                 console.print(f"Using existing GCS bucket for Terraform state: [cyan]gs://{bucket_name}[/cyan]")
 
@@ -2,14 +2,48 @@
 Cloud provider interface and implementations.
 Follows the Strategy pattern for different cloud platforms.
 """
+import functools
+import importlib
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, TypedDict, cast
 
 from rich.console import Console
 
 console = Console()
 
 
+# Shapes of the inventory records returned by the providers. They are plain dicts at runtime,
+# so records are built as literals and callers keep indexing them by key.
+class Region(TypedDict):
+    """A region as returned by list_regions"""
+
+    name: str
+    description: str
+
+
+class Network(TypedDict):
+    """A network/VPC as returned by list_networks"""
+
+    name: str
+    description: str
+
+
+class Subnet(TypedDict):
+    """A subnet as returned by list_subnets"""
+
+    name: str
+    region: str
+    ipCidrRange: str
+
+
+class SecurityGroup(TypedDict):
+    """A security group/firewall rule as returned by list_security_groups"""
+
+    name: str
+    network: str
+    direction: str
+
+
 class CloudProvider(ABC):
     """Abstract base class for cloud providers"""
 
@@ -24,7 +58,7 @@ class CloudProvider(ABC):
         pass
 
     @abstractmethod
-    def list_regions(self) -> List[Dict[str, Any]]:
+    def list_regions(self) -> List[Region]:
         """List available regions"""
         pass
 
@@ -34,17 +68,17 @@ class CloudProvider(ABC):
         pass
 
     @abstractmethod
-    def list_networks(self) -> List[Dict[str, Any]]:
+    def list_networks(self) -> List[Network]:
         """List available networks/VPCs"""
         pass
 
     @abstractmethod
-    def list_subnets(self, network_name: str) -> List[Dict[str, Any]]:
+    def list_subnets(self, network_name: str) -> List[Subnet]:
         """List available subnets for a network"""
         pass
 
     @abstractmethod
-    def list_security_groups(self) -> List[Dict[str, Any]]:
+    def list_security_groups(self) -> List[SecurityGroup]:
         """List available security groups/firewall rules"""
         pass
 
@@ -59,16 +93,27 @@ class CloudProvider(ABC):
         pass
 
 
+# Registered cloud providers as (module, class) so a provider's module is only imported when first requested
+_PROVIDERS: Dict[str, Tuple[str, str]] = {
+    "gcp": ("kafka_cli.core.cloud.gcp", "GCPProvider"),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _provider_instance(provider_type: str) -> CloudProvider:
+    """Instantiate a registered provider once, so its auth, project and inventory caches last the whole run"""
+    module_name, class_name = _PROVIDERS[provider_type]
+    return cast(CloudProvider, getattr(importlib.import_module(module_name), class_name)())
+
+
 # Factory for creating cloud providers
 class CloudProviderFactory:
     """Factory for creating cloud provider instances"""
 
     @staticmethod
     def create_provider(provider_type: str) -> CloudProvider:
-        """Create a cloud provider of the specified type"""
-        if provider_type.lower() == "gcp":
-            from kafka_cli.core.cloud.gcp import GCPProvider
-
-            return GCPProvider()
-        else:
+        """Get the cloud provider of the specified type, shared across calls"""
+        key = provider_type.lower()
+        if key not in _PROVIDERS:
             raise ValueError(f"Unsupported cloud provider: {provider_type}")
+        return _provider_instance(key)
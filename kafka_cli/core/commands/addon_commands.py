@@ -1,7 +1,7 @@
 """
 Add-on management commands implementation using the Command pattern.
 """
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import typer
 from rich.console import Console
@@ -62,6 +62,12 @@ class AddonConfiguration:
             "disk_size_gb": 10,
         },
     }
+    # The add-ons with their IDs folded in, built once since AVAILABLE_ADDONS never changes
+    _AVAILABLE_LIST: Tuple[Dict[str, Any], ...] = tuple(
+        {"id": addon_id, **properties} for addon_id, properties in AVAILABLE_ADDONS.items()
+    )
+    # Profile section names of the add-ons' settings, e.g. "addon_schema_registry"
+    _CONFIG_KEYS: Dict[str, str] = {addon_id: f"addon_{addon_id.replace('-', '_')}" for addon_id in AVAILABLE_ADDONS}
 
     @classmethod
     def get_addon_metadata(cls, addon_id: str) -> Optional[Dict[str, Any]]:
@@ -69,9 +75,18 @@ class AddonConfiguration:
         return cls.AVAILABLE_ADDONS.get(addon_id)
 
     @classmethod
-    def list_available_addons(cls) -> List[Dict[str, Any]]:
+    def get_config_key(cls, addon_id: str) -> str:
+        """Get the profile section holding an add-on's settings"""
+        config_key = cls._CONFIG_KEYS.get(addon_id)
+        if config_key is None:
+            # Profiles may name add-ons that are no longer offered
+            config_key = f"addon_{addon_id.replace('-', '_')}"
+        return config_key
+
+    @classmethod
+    def list_available_addons(cls) -> Tuple[Dict[str, Any], ...]:
         """List all available add-ons with their details"""
-        return [{"id": addon_id, **properties} for addon_id, properties in cls.AVAILABLE_ADDONS.items()]
+        return cls._AVAILABLE_LIST
 
     @classmethod
     def is_valid_addon(cls, addon_id: str) -> bool:
@@ -90,20 +105,16 @@ class AddonConfiguration:
     def add_addon_to_profile(cls, profile_data: Dict[str, Any], addon_id: str) -> Dict[str, Any]:
         """Add an add-on to a profile configuration"""
         # Initialize the addons section if it doesn't exist
-        if "addons" not in profile_data:
-            profile_data["addons"] = {"enabled": []}
-        elif "enabled" not in profile_data["addons"]:
-            profile_data["addons"]["enabled"] = []
+        enabled_addons = profile_data.setdefault("addons", {}).setdefault("enabled", [])
 
         # Add the add-on if not already in the list
-        enabled_addons = profile_data["addons"]["enabled"]
         if addon_id not in enabled_addons:
             enabled_addons.append(addon_id)
 
             # Initialize add-on-specific configuration with defaults
             addon_config = cls.get_addon_metadata(addon_id)
             if addon_config:
-                config_key = f"addon_{addon_id.replace('-', '_')}"
+                config_key = cls.get_config_key(addon_id)
                 profile_data[config_key] = {
                     "enabled": True,
                     "machine_type": addon_config.get("machine_type", "e2-small"),
@@ -116,22 +127,40 @@ class AddonConfiguration:
     @classmethod
     def remove_addon_from_profile(cls, profile_data: Dict[str, Any], addon_id: str) -> Dict[str, Any]:
         """Remove an add-on from a profile configuration"""
-        if "addons" in profile_data and "enabled" in profile_data["addons"]:
-            # Remove the add-on from the enabled list
-            enabled_addons = profile_data["addons"]["enabled"]
-            if addon_id in enabled_addons:
-                enabled_addons.remove(addon_id)
+        # Remove the add-on from the enabled list, a single scan whether or not it is there
+        enabled_addons = profile_data.get("addons", {}).get("enabled", [])
+        try:
+            enabled_addons.remove(addon_id)
+        except ValueError:
+            return profile_data
 
-                # Remove add-on-specific configuration
-                config_key = f"addon_{addon_id.replace('-', '_')}"
-                if config_key in profile_data:
-                    del profile_data[config_key]
+        # Remove add-on-specific configuration
+        profile_data.pop(cls.get_config_key(addon_id), None)
 
         return profile_data
 
 
+class AddonCommand(ProfileAwareCommand):
+    """Base class for commands that work on a profile's add-ons"""
+
+    def load_profile_with_addons(self, profile_name: Optional[str] = None) -> Tuple[Dict[str, Any], str, List[str]]:
+        """Load a profile with its name and installed add-ons, reporting a missing profile.
+
+        A missing profile comes back empty, with the name it was looked up under.
+        """
+        profile_data = self.get_profile(profile_name)
+        if not profile_data:
+            profile_name = profile_name or self.config_manager.get_active_profile_name() or "default"
+            console.print(f"[yellow]Profile '{profile_name}' not found.[/yellow]")
+            console.print("Use [bold]kafka-cli profiles create[/bold] to create a new profile.")
+            return {}, profile_name, []
+
+        profile_name = profile_data.get("profile", {}).get("name", "unknown")
+        return profile_data, profile_name, AddonConfiguration.get_installed_addons(profile_data)
+
+
 @CommandFactory.register("list_addons")
-class ListAddonsCommand(ProfileAwareCommand):
+class ListAddonsCommand(AddonCommand):
     """Command for listing all addons for a profile"""
 
     def name(self) -> str:
@@ -143,19 +172,10 @@ class ListAddonsCommand(ProfileAwareCommand):
     def execute(self, profile_name: Optional[str] = None, **kwargs) -> CommandResult[Dict[str, List[str]]]:
         """List all available and installed add-ons for a profile"""
         try:
-            # Load the profile
-            profile_data = self.get_profile(profile_name)
+            profile_data, profile_name, installed_addons = self.load_profile_with_addons(profile_name)
             if not profile_data:
-                profile_name = profile_name or self.config_manager.get_active_profile_name() or "default"
-                console.print(f"[yellow]Profile '{profile_name}' not found.[/yellow]")
-                console.print("Use [bold]kafka-cli profiles create[/bold] to create a new profile.")
                 return CommandResult.error(f"Profile '{profile_name}' not found")
 
-            profile_name = profile_data.get("profile", {}).get("name", "unknown")
-
-            # Get installed add-ons
-            installed_addons = AddonConfiguration.get_installed_addons(profile_data)
-
             # Get all available add-ons
             available_addons = AddonConfiguration.list_available_addons()
 
@@ -168,8 +188,10 @@ class ListAddonsCommand(ProfileAwareCommand):
             table.add_column("Description")
             table.add_column("Status", style="yellow")
 
+            # Look each row's status up in a set rather than scanning the installed list
+            installed_set = frozenset(installed_addons)
             for addon in available_addons:
-                status = "[bold green]INSTALLED[/bold green]" if addon["id"] in installed_addons else ""
+                status = "[bold green]INSTALLED[/bold green]" if addon["id"] in installed_set else ""
                 table.add_row(addon["id"], addon["name"], addon["description"], status)
 
             console.print(table)
@@ -186,7 +208,7 @@ class ListAddonsCommand(ProfileAwareCommand):
 
 
 @CommandFactory.register("install_addon")
-class InstallAddonCommand(ProfileAwareCommand):
+class InstallAddonCommand(AddonCommand):
     """Command for installing an addon to a profile"""
 
     def name(self) -> str:
@@ -198,27 +220,18 @@ class InstallAddonCommand(ProfileAwareCommand):
     def execute(self, addon_id: Optional[str] = None, profile_name: Optional[str] = None, **kwargs) -> CommandResult[bool]:
         """Install an add-on to a profile"""
         try:
-            # Load the profile
-            profile_data = self.get_profile(profile_name)
+            profile_data, profile_name, installed_addons = self.load_profile_with_addons(profile_name)
             if not profile_data:
-                profile_name = profile_name or self.config_manager.get_active_profile_name() or "default"
-                console.print(f"[yellow]Profile '{profile_name}' not found.[/yellow]")
-                console.print("Use [bold]kafka-cli profiles create[/bold] to create a new profile.")
                 return CommandResult.error(f"Profile '{profile_name}' not found")
 
-            profile_name = profile_data.get("profile", {}).get("name", "unknown")
-
-            # Get installed add-ons
-            installed_addons = AddonConfiguration.get_installed_addons(profile_data)
-
             # Get all available add-ons
             available_addons = AddonConfiguration.list_available_addons()
-            available_ids = [addon["id"] for addon in available_addons]
 
             # If no add-on specified, prompt for one
             if not addon_id:
                 # Filter out already installed add-ons
-                uninstalled_addons = [addon["id"] for addon in available_addons if addon["id"] not in installed_addons]
+                installed_set = frozenset(installed_addons)
+                uninstalled_addons = [addon["id"] for addon in available_addons if addon["id"] not in installed_set]
 
                 if not uninstalled_addons:
                     console.print("[yellow]All available add-ons are already installed.[/yellow]")
@@ -236,9 +249,9 @@ class InstallAddonCommand(ProfileAwareCommand):
                 addon_id = selected.split(" - ")[0]
 
             # Validate the add-on ID
-            if addon_id not in available_ids:
+            if not AddonConfiguration.is_valid_addon(addon_id):
                 console.print(f"[red]Add-on '{addon_id}' is not a valid add-on.[/red]")
-                console.print(f"Available add-ons: {', '.join(available_ids)}")
+                console.print(f"Available add-ons: {', '.join(AddonConfiguration.AVAILABLE_ADDONS)}")
                 return CommandResult.error(f"Invalid add-on ID: {addon_id}")
 
             # Check if already installed
@@ -254,7 +267,7 @@ class InstallAddonCommand(ProfileAwareCommand):
             updated_profile = AddonConfiguration.add_addon_to_profile(profile_data, addon_id)
 
             # Optional: Configure add-on settings interactively
-            config_key = f"addon_{addon_id.replace('-', '_')}"
+            config_key = AddonConfiguration.get_config_key(addon_id)
             if Prompt.confirm("Do you want to configure advanced settings for this add-on?", default=False):
                 if config_key in updated_profile:
                     # Machine type
@@ -295,7 +308,7 @@ class InstallAddonCommand(ProfileAwareCommand):
 
 
 @CommandFactory.register("uninstall_addon")
-class UninstallAddonCommand(ProfileAwareCommand):
+class UninstallAddonCommand(AddonCommand):
     """Command for uninstalling an addon from a profile"""
 
     def name(self) -> str:
@@ -309,19 +322,10 @@ class UninstallAddonCommand(ProfileAwareCommand):
     ) -> CommandResult[bool]:
         """Uninstall an add-on from a profile"""
         try:
-            # Load the profile
-            profile_data = self.get_profile(profile_name)
+            profile_data, profile_name, installed_addons = self.load_profile_with_addons(profile_name)
             if not profile_data:
-                profile_name = profile_name or self.config_manager.get_active_profile_name() or "default"
-                console.print(f"[yellow]Profile '{profile_name}' not found.[/yellow]")
-                console.print("Use [bold]kafka-cli profiles create[/bold] to create a new profile.")
                 return CommandResult.error(f"Profile '{profile_name}' not found")
 
-            profile_name = profile_data.get("profile", {}).get("name", "unknown")
-
-            # Get installed add-ons
-            installed_addons = AddonConfiguration.get_installed_addons(profile_data)
-
             if not installed_addons:
                 console.print(f"[yellow]No add-ons installed in profile '{profile_name}'.[/yellow]")
                 return CommandResult.error("No add-ons installed")
@@ -372,7 +376,7 @@ class UninstallAddonCommand(ProfileAwareCommand):
 
 
 @CommandFactory.register("configure_addon")
-class ConfigureAddonCommand(ProfileAwareCommand):
+class ConfigureAddonCommand(AddonCommand):
     """Command for configuring an addon in a profile"""
 
     def name(self) -> str:
@@ -384,19 +388,10 @@ class ConfigureAddonCommand(ProfileAwareCommand):
     def execute(self, addon_id: Optional[str] = None, profile_name: Optional[str] = None, **kwargs) -> CommandResult[Dict[str, Any]]:
         """Configure an installed add-on"""
         try:
-            # Load the profile
-            profile_data = self.get_profile(profile_name)
+            profile_data, profile_name, installed_addons = self.load_profile_with_addons(profile_name)
             if not profile_data:
-                profile_name = profile_name or self.config_manager.get_active_profile_name() or "default"
-                console.print(f"[yellow]Profile '{profile_name}' not found.[/yellow]")
-                console.print("Use [bold]kafka-cli profiles create[/bold] to create a new profile.")
                 return CommandResult.error(f"Profile '{profile_name}' not found")
 
-            profile_name = profile_data.get("profile", {}).get("name", "unknown")
-
-            # Get installed add-ons
-            installed_addons = AddonConfiguration.get_installed_addons(profile_data)
-
             if not installed_addons:
                 console.print(f"[yellow]No add-ons installed in profile '{profile_name}'.[/yellow]")
                 return CommandResult.error("No add-ons installed")
@@ -421,7 +416,7 @@ class ConfigureAddonCommand(ProfileAwareCommand):
 
             # Get add-on metadata and configuration
             addon_metadata = AddonConfiguration.get_addon_metadata(addon_id)
-            config_key = f"addon_{addon_id.replace('-', '_')}"
+            config_key = AddonConfiguration.get_config_key(addon_id)
 
             # If the add-on config section doesn't exist, create it
             if config_key not in profile_data:
@@ -1,6 +1,7 @@
+import json
 import os
 import pathlib
-from typing import Optional, Dict, Any
+from typing import IO, Optional, Dict, Any, Tuple
 
 import yaml
 from rich.console import Console
@@ -13,25 +14,37 @@ CONFIG_FILE = "config.yaml"
 PROFILES_DIR = "profiles"
 TERRAFORM_DIR = "terraform"
 
+# Prefer the libyaml-backed loader/dumper when PyYAML was built against libyaml
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Parsed profiles are cached as JSON next to the YAML file
+PROFILE_CACHE_SUFFIX = ".json"
+# Add-on state is kept in a small JSON overlay so toggling it leaves the profile YAML untouched
+PROFILE_ADDONS_SUFFIX = ".addons.json"
+
 # Current active configuration
 _config: Dict[str, Any] = {}
 _config_dir: str = DEFAULT_CONFIG_DIR
+_profiles_prefix: str = os.path.join(DEFAULT_CONFIG_DIR, PROFILES_DIR, "")
+_config_loaded: bool = False
 
 
 def init_config_dir(custom_config_dir: Optional[str] = None) -> str:
     """Initialize the configuration directory structure."""
-    global _config_dir
+    global _config_dir, _profiles_prefix
 
     if custom_config_dir:
         _config_dir = os.path.expanduser(custom_config_dir)
     else:
         _config_dir = DEFAULT_CONFIG_DIR
+    _profiles_prefix = os.path.join(_config_dir, PROFILES_DIR, "")
 
     # Create main config directory if it doesn't exist
     pathlib.Path(_config_dir).mkdir(parents=True, exist_ok=True)
 
     # Create profile and terraform directories
-    pathlib.Path(os.path.join(_config_dir, PROFILES_DIR)).mkdir(exist_ok=True)
+    pathlib.Path(get_profiles_dir()).mkdir(exist_ok=True)
     pathlib.Path(os.path.join(_config_dir, TERRAFORM_DIR)).mkdir(exist_ok=True)
 
     # Create default config file if it doesn't exist
@@ -50,7 +63,7 @@ def init_config_dir(custom_config_dir: Optional[str] = None) -> str:
                     'log_level': 'INFO',
                     'auto_approve': False,
                 },
-            }, f, default_flow_style=False)
+            }, f, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
         console.print(f"Created default configuration at [cyan]{config_path}[/cyan]")
 
     load_config()
@@ -59,12 +72,13 @@ def init_config_dir(custom_config_dir: Optional[str] = None) -> str:
 
 def load_config() -> Dict[str, Any]:
     """Load the configuration from the config file."""
-    global _config
+    global _config, _config_loaded
 
     config_path = os.path.join(_config_dir, CONFIG_FILE)
+    _config_loaded = True
     try:
-        with open(config_path, 'r') as f:
-            _config = yaml.safe_load(f) or {}
+        with open(config_path, 'rb') as f:
+            _config = yaml.load(f.read(), Loader=YamlLoader) or {}
         return _config
     except Exception as e:
         console.print(f"Error loading config: {str(e)}", style="red")
@@ -75,8 +89,10 @@ def save_config() -> bool:
     """Save the current configuration to the config file."""
     config_path = os.path.join(_config_dir, CONFIG_FILE)
     try:
-        with open(config_path, 'w') as f:
-            yaml.dump(_config, f, default_flow_style=False)
+        # Keep the loaded key order rather than sorting every mapping on each save
+        data = yaml.dump(_config, Dumper=YamlDumper, default_flow_style=False, sort_keys=False, encoding="utf-8")
+        with open(config_path, 'wb') as f:
+            f.write(data)
         return True
     except Exception as e:
         console.print(f"Error saving config: {str(e)}", style="red")
@@ -84,9 +100,8 @@ def save_config() -> bool:
 
 
 def get_config() -> Dict[str, Any]:
-    """Get the current configuration."""
-    global _config
-    if not _config:
+    """Get the current configuration, reading the config file at most once per process."""
+    if not _config_loaded:
         load_config()
     return _config
 
@@ -102,3 +117,199 @@ def get_config_dir() -> str:
     """Get the current configuration directory."""
     global _config_dir
     return _config_dir
+
+
+def get_profiles_dir() -> str:
+    """Get the directory holding the profile files."""
+    return _profiles_prefix[:-1]
+
+
+def get_profile_path(profile_name: str) -> str:
+    """Get the path of a profile's YAML file."""
+    return f"{_profiles_prefix}{profile_name}.yaml"
+
+
+def _resolve_profile_name(profile_name: Optional[str]) -> Optional[str]:
+    """Fall back to the default profile when no name is given, reporting if neither is set."""
+    if not profile_name:
+        profile_name = get_config().get("default_profile")
+
+    if not profile_name:
+        console.print("No profile specified and no default profile set", style="red")
+        return None
+
+    return profile_name
+
+
+def resolve_profile(profile_name: Optional[str] = None) -> Optional[Tuple[str, str]]:
+    """Resolve a profile name (or the default profile) to its name and path, reporting errors."""
+    profile_name = _resolve_profile_name(profile_name)
+    if profile_name is None:
+        return None
+
+    profile_path = get_profile_path(profile_name)
+    if not os.path.exists(profile_path):
+        console.print(f"Profile [bold red]{profile_name}[/bold red] not found", style="red")
+        return None
+
+    return profile_name, profile_path
+
+
+def resolve_and_load_profile(profile_name: Optional[str] = None) -> Optional[Tuple[str, str, Dict[str, Any]]]:
+    """Resolve and load a profile, returning its name, path and contents or None on error."""
+    profile_name = _resolve_profile_name(profile_name)
+    if profile_name is None:
+        return None
+
+    # Let the load itself detect a missing profile instead of checking first
+    profile_path = get_profile_path(profile_name)
+    try:
+        profile = load_profile(profile_path)
+    except FileNotFoundError:
+        console.print(f"Profile [bold red]{profile_name}[/bold red] not found", style="red")
+        return None
+    except Exception as e:
+        console.print(f"Error reading profile: {str(e)}", style="red")
+        return None
+
+    return profile_name, profile_path, profile
+
+
+def load_profile(profile_path: str) -> Dict[str, Any]:
+    """Load a profile, reusing the parsed JSON cache if the YAML is unchanged."""
+    cache_path = profile_path + PROFILE_CACHE_SUFFIX
+    profile_mtime = os.stat(profile_path).st_mtime_ns
+    profile = None
+    try:
+        if os.stat(cache_path).st_mtime_ns == profile_mtime:
+            with open(cache_path, 'rb') as f:
+                profile = json.loads(f.read())
+    except (OSError, ValueError):
+        pass
+
+    if profile is None:
+        # Hand libyaml the whole file as one bytes buffer rather than a text stream
+        with open(profile_path, 'rb') as f:
+            profile = yaml.load(f.read(), Loader=YamlLoader)
+        _write_profile_cache(profile_path, profile, profile_mtime)
+
+    # Add-on state saved since the profile was written takes precedence, a later edit of the YAML wins
+    if profile is not None:
+        try:
+            with open(_profile_addons_path(profile_path), 'rb') as f:
+                if os.fstat(f.fileno()).st_mtime_ns >= profile_mtime:
+                    profile["addons"] = json.loads(f.read())
+        except (OSError, ValueError):
+            # A missing, unreadable or corrupt overlay leaves the add-ons from the YAML in place
+            pass
+    return profile
+
+
+def save_profile(profile_path: str, profile: Dict[str, Any]) -> Optional[bool]:
+    """Write a profile to disk and refresh its parsed cache.
+
+    Returns None if the file was already up to date, otherwise whether an existing profile was replaced.
+    """
+    # Keep the profile's own key order
+    data = yaml.dump(profile, Dumper=YamlDumper, default_flow_style=False, sort_keys=False, encoding="utf-8")
+    # Reading the current file both detects an existing profile and spots a no-op save
+    try:
+        with open(profile_path, 'rb') as f:
+            if f.read() == data:
+                # The file already carries these add-ons, an overlay would only override them
+                _remove_if_exists(_profile_addons_path(profile_path))
+                return None
+        replaced = True
+    except FileNotFoundError:
+        replaced = False
+
+    # Write to an owner-only file, make it durable, then swap it in atomically
+    tmp_path = profile_path + ".tmp"
+    try:
+        with _open_owner_only(tmp_path, 'wb') as f:
+            # A buffered write retries short writes, so the whole profile lands or an error is raised
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, profile_path)
+    except BaseException:
+        _remove_if_exists(tmp_path)
+        raise
+    # The full profile now carries its own add-ons, drop any older overlay
+    _remove_if_exists(_profile_addons_path(profile_path))
+    _write_profile_cache(profile_path, profile, os.stat(profile_path).st_mtime_ns)
+    return replaced
+
+
+def save_profile_addons(profile_path: str, addons: Dict[str, Any]) -> None:
+    """Write only a profile's add-on state, leaving the profile YAML untouched."""
+    addons_path = _profile_addons_path(profile_path)
+    tmp_path = addons_path + ".tmp"
+    # Same owner-only, durable, atomic write as the profile itself
+    try:
+        with _open_owner_only(tmp_path, 'w') as f:
+            json.dump(addons, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, addons_path)
+    except BaseException:
+        _remove_if_exists(tmp_path)
+        raise
+
+
+def remove_profile(profile_path: str) -> None:
+    """Delete a profile together with its parsed cache and add-on state."""
+    os.remove(profile_path)
+    _remove_if_exists(profile_path + PROFILE_CACHE_SUFFIX)
+    _remove_if_exists(_profile_addons_path(profile_path))
+
+
+def _profile_addons_path(profile_path: str) -> str:
+    """Get the path of the add-on overlay for a profile's YAML file."""
+    return profile_path[:-len(".yaml")] + PROFILE_ADDONS_SUFFIX
+
+
+def _open_owner_only(path: str, mode: str) -> IO[Any]:
+    """Open a file for writing, creating or truncating it with owner-only (0o600) permissions."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    # The mode only applies on creation, so also tighten a file left over from an older run
+    os.fchmod(fd, 0o600)
+    return open(fd, mode)
+
+
+def _remove_if_exists(path: str) -> None:
+    """Delete a file, ignoring it if it is already gone."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _write_profile_cache(profile_path: str, profile: Any, profile_mtime: int) -> None:
+    """Store the parsed profile as JSON, stamped with the mtime of its YAML source."""
+    # Only cache profiles that come back from JSON unchanged: JSON has no dates or sets and turns
+    # non-string keys into strings, so such profiles are always read from the YAML instead
+    cache_path = profile_path + PROFILE_CACHE_SUFFIX
+    try:
+        data = json.dumps(profile)
+        cacheable = json.loads(data) == profile
+    except (TypeError, ValueError):
+        cacheable = False
+    if not cacheable:
+        # Drop the cache left by an earlier, cacheable revision of this profile
+        _remove_if_exists(cache_path)
+        return
+
+    tmp_path = cache_path + ".tmp"
+    try:
+        # The cache holds the same contents as the profile, so it is owner-only too
+        with _open_owner_only(tmp_path, 'w') as f:
+            f.write(data)
+        os.utime(tmp_path, ns=(profile_mtime, profile_mtime))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # The cache is only an optimisation, the YAML file stays authoritative
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
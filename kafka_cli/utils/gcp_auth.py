@@ -1,14 +1,80 @@
+import functools
 import json
 import os
 import shutil
 import subprocess
-from typing import Any, Dict, List, Optional, Union, cast
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union, cast
 
 from rich.console import Console
 
 from kafka_cli.core.errors import AuthenticationError, CommandError, ConfigurationError, ErrorHandler, ErrorSeverity
 
 console = Console()
+T = TypeVar("T")
+
+# How long GCP lookups (regions, zones, VPCs, ...) are reused within one process,
+# overridable with KAFKA_CLI_GCP_CACHE_TTL
+DEFAULT_GCP_CACHE_TTL_SECONDS = 300.0
+
+
+def _cache_ttl_from_env() -> float:
+    """
+    Read the GCP lookup cache TTL from the environment
+
+    Returns:
+        float: TTL in seconds, the default if the variable is unset or not a number
+    """
+    try:
+        return float(os.environ.get("KAFKA_CLI_GCP_CACHE_TTL", DEFAULT_GCP_CACHE_TTL_SECONDS))
+    except ValueError:
+        return DEFAULT_GCP_CACHE_TTL_SECONDS
+
+
+GCP_CACHE_TTL_SECONDS = _cache_ttl_from_env()
+
+# Common regions offered when the real list cannot be fetched
+DEFAULT_GCP_REGIONS = ("us-central1", "us-east1", "us-west1", "europe-west1", "asia-east1")
+
+
+def _ttl_cache(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    Memoize a GCP lookup per argument tuple for GCP_CACHE_TTL_SECONDS
+
+    Empty results (None or []) are not cached, the same rule as the provider cache in
+    kafka_cli.core.cloud._cache, so a failed lookup is retried on the next call.
+
+    Args:
+        func: Lookup function taking only hashable positional arguments
+
+    Returns:
+        Callable: Wrapped function, with a cache_clear() method to drop cached results
+    """
+    cache: Dict[Tuple[Any, ...], Tuple[T, float]] = {}
+    lock = threading.Lock()
+
+    @functools.wraps(func)
+    def wrapper(*args: Any) -> T:
+        now = time.monotonic()
+        with lock:
+            entry = cache.get(args)
+        if entry is not None and entry[1] > now:
+            return entry[0]
+
+        # Run the lookup outside the lock so concurrent lookups don't serialize
+        value = func(*args)
+        if value:
+            with lock:
+                cache[args] = (value, now + GCP_CACHE_TTL_SECONDS)
+        return value
+
+    def cache_clear() -> None:
+        with lock:
+            cache.clear()
+
+    wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+    return wrapper
 
 
 def is_gcloud_installed() -> bool:
@@ -38,8 +104,9 @@ def check_gcp_auth() -> bool:
                 help_text="Please install the Google Cloud SDK from: https://cloud.google.com/sdk/docs/install",
             )
 
-        result = subprocess.run(["gcloud", "auth", "list", "--format", "json"], capture_output=True, text=True, check=True)
+        result = subprocess.run(["gcloud", "auth", "list", "--format", "json"], capture_output=True, check=True)
 
+        # gcloud's JSON output is parsed straight from the captured bytes, as everywhere below
         auth_list = json.loads(result.stdout)
         if not auth_list:
             raise AuthenticationError(
@@ -134,7 +201,7 @@ def list_gcp_configurations() -> List[Dict[str, Any]]:
             return []
 
         result = subprocess.run(
-            ["gcloud", "config", "configurations", "list", "--format", "json"], capture_output=True, text=True, check=True
+            ["gcloud", "config", "configurations", "list", "--format", "json"], capture_output=True, check=True
         )
 
         configurations = json.loads(result.stdout)
@@ -172,6 +239,10 @@ def activate_gcp_configuration(config_name: str) -> bool:
 
         subprocess.run(["gcloud", "config", "configurations", "activate", config_name], capture_output=True, text=True, check=True)
 
+        # Cached lookups belong to the previous configuration's project
+        for lookup in (_fetch_gcp_regions, _fetch_zones_for_region, list_gcp_vpcs, list_subnets_for_vpc, list_security_groups):
+            lookup.cache_clear()  # type: ignore[attr-defined]
+
         console.print(f"[bold green]Activated GCP configuration:[/bold green] {config_name}")
         return True
 
@@ -270,17 +341,30 @@ def list_gcp_regions() -> List[str]:
     Get list of available GCP regions
 
     Returns:
-        List[str]: List of GCP region names
+        List[str]: List of GCP region names, or common regions if they cannot be listed
     """
     if not is_gcloud_installed():
         error_msg = "Using default regions list: Google Cloud SDK not installed"
         ErrorHandler().handle_exception(ConfigurationError(error_msg, severity=ErrorSeverity.WARNING))
         # Return common regions as fallback
-        return ["us-central1", "us-east1", "us-west1", "europe-west1", "asia-east1"]
+        return list(DEFAULT_GCP_REGIONS)
+
+    regions = _fetch_gcp_regions()
+    # The fallback is applied outside the cache, so a failed listing is retried next time
+    return regions if regions is not None else list(DEFAULT_GCP_REGIONS)
 
+
+@_ttl_cache
+def _fetch_gcp_regions() -> Optional[List[str]]:
+    """
+    List GCP regions with gcloud, reporting any failure
+
+    Returns:
+        Optional[List[str]]: List of GCP region names, or None if they could not be listed
+    """
     try:
         result = subprocess.run(
-            ["gcloud", "compute", "regions", "list", "--format", "json"], capture_output=True, text=True, check=True
+            ["gcloud", "compute", "regions", "list", "--format", "json"], capture_output=True, check=True
         )
 
         regions_data = json.loads(result.stdout)
@@ -289,16 +373,15 @@ def list_gcp_regions() -> List[str]:
     except subprocess.CalledProcessError as e:
         error_msg = f"Error listing GCP regions: {str(e)}"
         ErrorHandler().handle_exception(CommandError(error_msg, command="gcloud compute regions list"))
-        # Return common regions as fallback
-        return ["us-central1", "us-east1", "us-west1", "europe-west1", "asia-east1"]
+        return None
     except json.JSONDecodeError:
         error_msg = "Invalid response from gcloud while listing regions"
         ErrorHandler().handle_exception(CommandError(error_msg))
-        return ["us-central1", "us-east1", "us-west1", "europe-west1", "asia-east1"]
+        return None
     except Exception as e:
         error_msg = f"Unexpected error listing GCP regions: {str(e)}"
         ErrorHandler().handle_exception(CommandError(error_msg))
-        return ["us-central1", "us-east1", "us-west1", "europe-west1", "asia-east1"]
+        return None
 
 
 def get_zones_for_region(region: str) -> List[str]:
@@ -309,7 +392,7 @@ def get_zones_for_region(region: str) -> List[str]:
         region: GCP region name
 
     Returns:
-        List[str]: List of zone names
+        List[str]: List of zone names, or the usual zone names if they cannot be listed
     """
     if not is_gcloud_installed():
         error_msg = f"Using default zones for region {region}: Google Cloud SDK not installed"
@@ -317,11 +400,26 @@ def get_zones_for_region(region: str) -> List[str]:
         # Return common zones for the region as fallback
         return [f"{region}-a", f"{region}-b", f"{region}-c"]
 
+    zones = _fetch_zones_for_region(region)
+    # The fallback is applied outside the cache, so a failed listing is retried next time
+    return zones if zones is not None else [f"{region}-a", f"{region}-b", f"{region}-c"]
+
+
+@_ttl_cache
+def _fetch_zones_for_region(region: str) -> Optional[List[str]]:
+    """
+    List the zones of a GCP region with gcloud, reporting any failure
+
+    Args:
+        region: GCP region name
+
+    Returns:
+        Optional[List[str]]: List of zone names, or None if they could not be listed
+    """
     try:
         result = subprocess.run(
             ["gcloud", "compute", "zones", "list", "--filter", f"region:{region}", "--format", "json"],
             capture_output=True,
-            text=True,
             check=True,
         )
 
@@ -331,17 +429,18 @@ def get_zones_for_region(region: str) -> List[str]:
     except subprocess.CalledProcessError as e:
         error_msg = f"Error listing zones for region {region}: {str(e)}"
         ErrorHandler().handle_exception(CommandError(error_msg, command=f"gcloud compute zones list --filter region:{region}"))
-        return [f"{region}-a", f"{region}-b", f"{region}-c"]
+        return None
     except json.JSONDecodeError:
         error_msg = f"Invalid response from gcloud while listing zones for region {region}"
         ErrorHandler().handle_exception(CommandError(error_msg))
-        return [f"{region}-a", f"{region}-b", f"{region}-c"]
+        return None
     except Exception as e:
         error_msg = f"Unexpected error listing zones for region {region}: {str(e)}"
         ErrorHandler().handle_exception(CommandError(error_msg))
-        return [f"{region}-a", f"{region}-b", f"{region}-c"]
+        return None
 
 
+@_ttl_cache
 def list_gcp_vpcs() -> List[Dict[str, Any]]:
     """
     Get list of VPC networks in the project
@@ -356,7 +455,7 @@ def list_gcp_vpcs() -> List[Dict[str, Any]]:
 
     try:
         result = subprocess.run(
-            ["gcloud", "compute", "networks", "list", "--format", "json"], capture_output=True, text=True, check=True
+            ["gcloud", "compute", "networks", "list", "--format", "json(name)"], capture_output=True, check=True
         )
 
         vpc_data = json.loads(result.stdout)
@@ -376,6 +475,7 @@ def list_gcp_vpcs() -> List[Dict[str, Any]]:
         return []
 
 
+@_ttl_cache
 def list_subnets_for_vpc(vpc_name: str) -> List[Dict[str, Any]]:
     """
     Get list of subnets for a specific VPC
@@ -393,9 +493,18 @@ def list_subnets_for_vpc(vpc_name: str) -> List[Dict[str, Any]]:
 
     try:
         result = subprocess.run(
-            ["gcloud", "compute", "networks", "subnets", "list", "--filter", f"network:{vpc_name}", "--format", "json"],
+            [
+                "gcloud",
+                "compute",
+                "networks",
+                "subnets",
+                "list",
+                "--filter",
+                f"network:{vpc_name}",
+                "--format",
+                "json(name,ipCidrRange,region)",
+            ],
             capture_output=True,
-            text=True,
             check=True,
         )
 
@@ -418,6 +527,7 @@ def list_subnets_for_vpc(vpc_name: str) -> List[Dict[str, Any]]:
         return []
 
 
+@_ttl_cache
 def list_security_groups() -> List[Dict[str, Any]]:
     """
     Get list of firewall rules (equivalent to security groups)
@@ -432,7 +542,9 @@ def list_security_groups() -> List[Dict[str, Any]]:
 
     try:
         result = subprocess.run(
-            ["gcloud", "compute", "firewall-rules", "list", "--format", "json"], capture_output=True, text=True, check=True
+            ["gcloud", "compute", "firewall-rules", "list", "--format", "json(name,description)"],
+            capture_output=True,
+            check=True,
         )
 
         firewall_data = json.loads(result.stdout)
@@ -9,12 +9,26 @@ from rich.console import Console
 console = Console()
 
 
+# Result of the interactive-environment probe, filled in on first use
+_interactive = None
+
+
 def is_interactive():
     """
     Check if the current environment is interactive.
     Tests multiple conditions to ensure we don't try to use interactive prompts
-    in environments that don't support them.
+    in environments that don't support them. The conditions cannot change during
+    a run, so they are probed once and every prompt reuses the answer.
     """
+    global _interactive
+
+    if _interactive is None:
+        _interactive = _probe_interactive()
+    return _interactive
+
+
+def _probe_interactive():
+    """Run the actual interactive-environment checks."""
     # Check if stdin is a TTY device
     if not sys.stdin.isatty():
         return False
@@ -1,3 +1,5 @@
+import functools
+import hashlib
 import json
 import os
 import shutil
@@ -12,6 +14,74 @@ from kafka_cli.utils.config import get_config_dir
 console = Console()
 
 
+@functools.lru_cache(maxsize=1)
+def find_terraform_binary() -> Optional[str]:
+    """
+    Locate the Terraform executable on PATH, searching only once per process
+
+    Returns:
+        Optional[str]: Absolute path to the terraform binary, or None if it is not installed
+    """
+    return shutil.which("terraform")
+
+
+# Fingerprint of the configuration a working directory was last initialized for
+TERRAFORM_INIT_STAMP = os.path.join(".terraform", "kafka-cli-init.sha256")
+
+
+def terraform_config_fingerprint(terraform_dir: str) -> str:
+    """
+    Hash the Terraform configuration files in a working directory
+
+    Args:
+        terraform_dir: Terraform working directory
+
+    Returns:
+        str: Hex digest covering the names and contents of the *.tf and *.tf.json files
+    """
+    digest = hashlib.sha256()
+    for entry in sorted(os.scandir(terraform_dir), key=lambda entry: entry.name):
+        if entry.is_file() and entry.name.endswith((".tf", ".tf.json")):
+            digest.update(entry.name.encode() + b"\0")
+            with open(entry.path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def is_terraform_initialized(terraform_dir: str, fingerprint: str) -> bool:
+    """
+    Check whether `terraform init` already ran for this exact configuration
+
+    Args:
+        terraform_dir: Terraform working directory
+        fingerprint: Current result of terraform_config_fingerprint()
+
+    Returns:
+        bool: True if the recorded init fingerprint matches, False if init is needed
+    """
+    try:
+        with open(os.path.join(terraform_dir, TERRAFORM_INIT_STAMP)) as f:
+            return f.read() == fingerprint
+    except OSError:
+        return False
+
+
+def mark_terraform_initialized(terraform_dir: str, fingerprint: str) -> None:
+    """
+    Record that `terraform init` succeeded for a configuration
+
+    Args:
+        terraform_dir: Terraform working directory
+        fingerprint: Result of terraform_config_fingerprint() taken before the init
+    """
+    try:
+        with open(os.path.join(terraform_dir, TERRAFORM_INIT_STAMP), "w") as f:
+            f.write(fingerprint)
+    except OSError:
+        # Without the stamp the next command simply runs init again
+        pass
+
+
 def generate_terraform_vars(config: Dict[str, Any], dry_run: bool = False) -> bool:
     """
     Generate Terraform variables file from the configuration dictionary
@@ -40,7 +110,8 @@ def generate_terraform_vars(config: Dict[str, Any], dry_run: bool = False) -> bo
             # Network configuration
             "network_name": config.get("networking", {}).get("network_name", "kafka-network"),
             "network_cidr": config.get("networking", {}).get("network_cidr", "10.0.0.0/16"),
-            "subnet_cidr": config.get("networking", {}).get("subnet_cidr", "10.0.1.0/24"),
+            # The wizard records no subnet CIDR (None) unless it creates a new subnet
+            "subnet_cidr": config.get("networking", {}).get("subnet_cidr") or "10.0.1.0/24",
             "enable_vpc_peering": config.get("networking", {}).get("enable_peering", False),
             "peering_network": config.get("networking", {}).get("peering_network", ""),
             # Kafka configuration
@@ -172,7 +243,8 @@ def run_terraform_command(
     """
     try:
         # Check if terraform is installed
-        if not shutil.which("terraform"):
+        terraform_bin = find_terraform_binary()
+        if not terraform_bin:
             raise ConfigurationError(
                 "Terraform not found in PATH", help_text="Please install Terraform from https://www.terraform.io/downloads.html"
             )
@@ -181,22 +253,25 @@ def run_terraform_command(
         terraform_dir = os.path.join(get_config_dir(), "terraform")
         os.makedirs(terraform_dir, exist_ok=True)
 
-        # Initialize Terraform if not already initialized
-        init_result = subprocess.run(
-            ["terraform", "init"],
-            cwd=terraform_dir,
-            capture_output=True,
-            text=True,
-        )
-
-        if init_result.returncode != 0:
-            raise CommandError(
-                "Terraform initialization failed",
-                command="terraform init",
-                details={"stderr": init_result.stderr},
-                help_text="Check network connectivity and permissions",
+        # Initialize Terraform unless it already was for this exact configuration
+        fingerprint = terraform_config_fingerprint(terraform_dir)
+        if not is_terraform_initialized(terraform_dir, fingerprint):
+            init_result = subprocess.run(
+                [terraform_bin, "init", "-input=false"],
+                cwd=terraform_dir,
+                capture_output=True,
+                text=True,
             )
 
+            if init_result.returncode != 0:
+                raise CommandError(
+                    "Terraform initialization failed",
+                    command="terraform init",
+                    details={"stderr": init_result.stderr},
+                    help_text="Check network connectivity and permissions",
+                )
+            mark_terraform_initialized(terraform_dir, fingerprint)
+
         # Prepare the command arguments
         cmd = ["terraform", command]
 
@@ -216,8 +291,9 @@ def run_terraform_command(
         # Run the command
         console.print(f"Running: [bold]{' '.join(cmd)}[/bold]")
 
+        # Run the resolved binary, keeping the plain command name for messages
         process = subprocess.run(
-            cmd,
+            [terraform_bin, *cmd[1:]],
             cwd=terraform_dir,
             capture_output=True,
             text=True,